@@ -159,33 +159,33 @@ def calculate_risk_metric(df):
     """
     print("🧮 Calculating Risk Metric...")
     
-    data = df.copy().dropna()
+    data = df.dropna()
+    close = data['Close']
     
     # Prepare logarithmic data
-    data['log_price'] = np.log(data['Close'])
-    data['time_idx'] = np.arange(1, len(data) + 1)
-    data['log_time'] = np.log(data['time_idx'])
+    log_price = np.log(close.to_numpy())
+    log_time = np.log(np.arange(1, len(data) + 1))
     
     # Fit Linear Regression on Log-Log data
     try:
-        slope, intercept = np.polyfit(data['log_time'], data['log_price'], 1)
-        data['fair_value'] = np.exp(intercept + slope * data['log_time'])
+        slope, intercept = np.polyfit(log_time, log_price, 1)
+        fair_value = np.exp(intercept + slope * log_time)
         
         # Calculate % Deviation from Fair Value
-        data['deviation'] = (data['Close'] - data['fair_value']) / data['fair_value']
+        deviation = (close - fair_value) / fair_value
         
         # Normalize to 0-1 using rolling 200-week window (~4 years)
-        roll_min = data['deviation'].rolling(window=200, min_periods=50).min()
-        roll_max = data['deviation'].rolling(window=200, min_periods=50).max()
+        window = deviation.rolling(window=200, min_periods=50)
+        roll_min = window.min()
+        roll_max = window.max()
         
-        data['risk'] = (data['deviation'] - roll_min) / (roll_max - roll_min)
-        data['risk'] = data['risk'].clip(0, 1)  # Ensure 0-1 range
+        risk = ((deviation - roll_min) / (roll_max - roll_min)).clip(0, 1)  # Ensure 0-1 range
         
         # Get last 52 weeks of risk data for charting
-        risk_history = data['risk'].tail(52).fillna(0.5).tolist()
+        risk_history = risk.tail(52).fillna(0.5).tolist()
         
-        current_risk = float(data['risk'].iloc[-1])
-        previous_risk = float(data['risk'].iloc[-2])
+        current_risk = float(risk.iloc[-1])
+        previous_risk = float(risk.iloc[-2])
         
         print(f"✅ Risk Metric: {current_risk:.2f}")
         return current_risk, previous_risk, risk_history
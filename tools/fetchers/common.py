@@ -0,0 +1,945 @@
+"""
+Shared infrastructure for the unified fetchers (v2 and v3).
+
+Both scripts fetch the same data the same way, so the data store, HTTP
+session, caches, rate limiting, fetch functions and dashboard file helpers
+live here once and are imported by each script.
+"""
+
+import os
+import json
+import logging
+import pathlib
+import time
+import hashlib
+import sqlite3
+import functools
+import importlib.util
+import threading
+import bisect
+import math
+from datetime import datetime, timezone, timedelta
+from typing import Dict, List, Optional, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+
+logger = logging.getLogger(__name__)
+
+# Paths
+ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
+DATA_DIR = ROOT_DIR / 'data'
+CACHE_DIR = DATA_DIR / 'cache'
+CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# One clock reading per run, so every dashboard written by it carries the same timestamp
+RUN_STARTED_AT = datetime.now(timezone.utc)
+RUN_TIMESTAMP = RUN_STARTED_AT.strftime('%Y-%m-%d %H:%M:%S UTC')
+
+# Third-party imports
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+    logging.warning("requests not available")
+
+# Seconds allowed to open a connection. Kept short so a dead host fails fast;
+# each call pairs it with a read timeout sized for that endpoint
+CONNECT_TIMEOUT = 4
+
+if REQUESTS_AVAILABLE:
+    # One pooled keep-alive session for every fetcher and AI call. GETs retry
+    # transient 5xx/connection errors with backoff; POSTs are never retried here
+    http_session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, read=1, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+    )
+    # Mounted for both schemes so a plain-http feed URL or redirect gets the same pooling and retries
+    http_session.mount('https://', adapter)
+    http_session.mount('http://', adapter)
+
+try:
+    import yfinance as yf
+    YFINANCE_AVAILABLE = True
+except ImportError:
+    YFINANCE_AVAILABLE = False
+
+try:
+    import feedparser
+    FEEDPARSER_AVAILABLE = True
+except ImportError:
+    FEEDPARSER_AVAILABLE = False
+
+try:
+    import numpy as np
+    # yf.download hands back pandas DataFrames, but nothing here calls pandas
+    # directly, so only its presence is checked
+    PANDAS_AVAILABLE = importlib.util.find_spec('pandas') is not None
+except ImportError:
+    PANDAS_AVAILABLE = False
+
+# lxml's C parser (listed in tools/requirements.txt) is used for the arXiv Atom
+# feed; the stdlib ElementTree API is compatible for everything used here, so
+# a local run without lxml still works
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def json_loads(data: Any) -> Any:
+    """Parse JSON from str or bytes, using orjson when available."""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize obj to JSON bytes (compact, or 2-space indented), using orjson when available."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=2).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+_JSON_DECODER = json.JSONDecoder()
+
+def extract_json(text: str) -> Dict:
+    """
+    Decode the first JSON object in an AI response.
+    Decoding stops where that object ends, so surrounding prose or code
+    fences don't matter. Raises json.JSONDecodeError if there is none.
+    """
+    start = text.find('{')
+    if start == -1:
+        raise json.JSONDecodeError("No JSON object found", text, 0)
+    obj, _ = _JSON_DECODER.raw_decode(text, start)
+    return obj
+
+def bullet_list(items: List[str], max_tokens: int = 400) -> str:
+    """
+    Join items into '- item' lines for a prompt, stopping once the estimated
+    size (~4 characters per token) would pass max_tokens.
+    Whole lines are kept or dropped, except that a first item too long for the
+    budget on its own is cut to fit rather than leaving the list empty.
+    """
+    lines = []
+    budget = max_tokens * 4
+    for item in items:
+        line = f"- {item}"
+        if not lines and len(line) > budget:
+            lines.append(line[:max(budget - 3, 3)] + "...")
+            break
+        budget -= len(line) + 1
+        if budget < 0:
+            break
+        lines.append(line)
+    return "\n".join(lines)
+
+# ========================================
+# Centralized Data Store
+# ========================================
+
+@functools.lru_cache(maxsize=1)
+def _iso_for_second(second: int) -> str:
+    return datetime.fromtimestamp(second, timezone.utc).isoformat()
+
+def utc_now_iso() -> str:
+    """Current UTC time in ISO format, formatted at most once per second."""
+    return _iso_for_second(int(time.time()))
+
+class DataStore:
+    """
+    Centralized in-memory store for all fetched data.
+    Prevents duplicate API calls across dashboards.
+    """
+    def __init__(self):
+        self.data = {}
+        self.fetched_at = {}
+        # Fetchers write concurrently (see fetch_all) - keep data/fetched_at in step
+        self._lock = threading.Lock()
+    
+    def set(self, key: str, value: Any):
+        fetched_at = utc_now_iso()
+        with self._lock:
+            self.data[key] = value
+            self.fetched_at[key] = fetched_at
+        logger.info(f"📦 Stored: {key}")
+    
+    def get(self, key: str) -> Any:
+        return self.data.get(key)
+    
+    def has(self, key: str) -> bool:
+        return key in self.data
+    
+    def to_dict(self) -> Dict:
+        return {
+            'data': self.data,
+            'fetched_at': self.fetched_at,
+            'timestamp': utc_now_iso()
+        }
+
+# Global data store instance
+store = DataStore()
+
+# Global flag to track quota status
+AI_QUOTA_EXCEEDED = False
+AI_QUOTA_EXCEEDED_AT = 0.0
+AI_QUOTA_COOLDOWN = 10 * 60  # Seconds before AI calls are retried after a quota error
+
+def mark_ai_quota_exceeded():
+    """Skip every AI call until the quota cooldown has elapsed."""
+    global AI_QUOTA_EXCEEDED, AI_QUOTA_EXCEEDED_AT
+    AI_QUOTA_EXCEEDED = True
+    AI_QUOTA_EXCEEDED_AT = time.time()
+
+def ai_quota_exceeded() -> bool:
+    """True while a recent quota error is still cooling down."""
+    global AI_QUOTA_EXCEEDED
+    if AI_QUOTA_EXCEEDED and time.time() - AI_QUOTA_EXCEEDED_AT >= AI_QUOTA_COOLDOWN:
+        logger.info("  ℹ️ AI quota cooldown elapsed. Re-enabling AI calls.")
+        AI_QUOTA_EXCEEDED = False
+    return AI_QUOTA_EXCEEDED
+
+# ========================================
+# Single-Flight Request Coalescing
+# ========================================
+
+_inflight: Dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+def single_flight(func):
+    """
+    Coalesce concurrent duplicate calls into one in-flight request.
+    The first caller runs the fetch; callers arriving while it is still
+    running wait for its result instead of firing their own request.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = f"{func.__name__}:{args!r}:{sorted(kwargs.items())!r}"
+        with _inflight_lock:
+            future = _inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                _inflight[key] = future
+        
+        if not is_leader:
+            return future.result()
+        
+        try:
+            result = func(*args, **kwargs)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with _inflight_lock:
+                _inflight.pop(key, None)
+    return wrapper
+
+# ========================================
+# Rate Limiting
+# ========================================
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: rate tokens per second, up to burst banked.
+    acquire() only blocks when the caller would exceed the rate, so
+    requests spaced out by other work (or served from cache) never wait.
+    """
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Going negative reserves a future slot, so concurrent callers queue up in order
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
+
+# ========================================
+# Persistent Fetch Cache
+# ========================================
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache with per-entry TTL.
+    Entries survive process restarts. Live entries are served from an
+    in-memory tier; a missing or expired one is looked up in SQLite again.
+    """
+    def __init__(self, path: pathlib.Path):
+        # path may also be ':memory:' for a cache that lasts only as long as the process
+        self._memory = {}
+        self._lock = threading.Lock()
+        # WAL + busy timeout let several fetcher processes share one cache file
+        self._conn = sqlite3.connect(str(path), timeout=30, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)'
+        )
+        self._conn.commit()
+    
+    def get(self, key: str) -> Any:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is None or entry[1] <= now:
+                # Another process sharing the file may have refreshed the row since
+                row = self._conn.execute('SELECT value, expires_at FROM cache WHERE key = ?', (key,)).fetchone()
+                if row is None:
+                    return None
+                entry = (json_loads(row[0]), row[1])
+                self._memory[key] = entry
+        value, expires_at = entry
+        return value if expires_at > now else None
+    
+    def set(self, key: str, value: Any, ttl: float):
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._memory[key] = (value, expires_at)
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)',
+                (key, json_dumps(value).decode('utf-8'), expires_at)
+            )
+            self._conn.commit()
+
+def open_disk_cache(path: pathlib.Path) -> DiskCache:
+    """
+    Open a DiskCache, recreating the file if it is corrupt or unreadable.
+    If that fails too the cache runs in memory only, so a bad cache file
+    costs this run its persistence instead of aborting it at import.
+    """
+    try:
+        return DiskCache(path)
+    except sqlite3.Error as e:
+        logger.warning(f"⚠️ Cache file {path} unusable ({e}), recreating it")
+    
+    try:
+        for suffix in ('', '-wal', '-shm'):
+            pathlib.Path(f'{path}{suffix}').unlink(missing_ok=True)
+        return DiskCache(path)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"⚠️ Could not recreate {path} ({e}), caching in memory only for this run")
+        return DiskCache(':memory:')
+
+# Global fetch cache instance
+fetch_cache = open_disk_cache(CACHE_DIR / 'fetch_cache.sqlite3')
+
+def cache_reads_enabled() -> bool:
+    """False when --no-cache asked for a forced refresh; fresh results are still written back."""
+    return os.environ.get('DISABLE_CACHE') != 'true'
+
+_key_locks: Dict[str, threading.Lock] = {}
+_key_locks_guard = threading.Lock()
+
+def _key_lock(key: str) -> threading.Lock:
+    with _key_locks_guard:
+        return _key_locks.setdefault(key, threading.Lock())
+
+def cached_call(key: str, ttl: float, producer) -> Any:
+    """
+    Return the cached value for key, or call producer() and cache its result for ttl seconds.
+    Concurrent misses on the same key wait for a single producer call instead
+    of stampeding the upstream endpoint.
+    """
+    value = fetch_cache.get(key) if cache_reads_enabled() else None
+    if value is not None:
+        logger.info(f"  💾 Cache hit: {key}")
+        return value
+    
+    with _key_lock(key):
+        # Another caller may have filled the entry while this one waited
+        value = fetch_cache.get(key) if cache_reads_enabled() else None
+        if value is not None:
+            logger.info(f"  💾 Cache hit: {key}")
+            return value
+        
+        value = producer()
+        if value is not None:
+            fetch_cache.set(key, value, ttl)
+        return value
+
+# ========================================
+# Fetch Functions (Call ONCE)
+# ========================================
+
+def set_with_fallback(name: str, price: Optional[float]):
+    """
+    Store market.{name} and its .stale flag.
+    The store starts empty every run, so the last good price is kept on disk.
+    A failed lookup (price None) reuses it flagged as stale instead of leaving a hole.
+    """
+    key = f'market.{name}'
+    if price is None:
+        last_known = fetch_cache.get(f'last.{key}')
+        if last_known is not None:
+            logger.warning(f"  Using last known {name} price (stale)")
+            store.set(key, last_known)
+            store.set(f'{key}.stale', True)
+        return
+    store.set(key, price)
+    store.set(f'{key}.stale', False)
+    fetch_cache.set(f'last.{key}', price, 7 * 86400)
+
+def stale_prices(names: List[str]) -> List[str]:
+    """The names whose market price is a last known fallback rather than this run's quote."""
+    return [name for name in names if store.get(f'market.{name}.stale')]
+
+def stale_price_note(stale: List[str]) -> str:
+    """Prompt paragraph flagging fallback prices to the model (empty when every quote is live)."""
+    if not stale:
+        return ""
+    return f"\nNOTE: No live quote this run for {', '.join(stale)} - the value shown is the last known price (up to 7 days old).\n"
+
+@single_flight
+def fetch_market_data():
+    """Fetch ALL market data once - used by multiple dashboards"""
+    logger.debug("=" * 50)
+    logger.info("📈 FETCHING MARKET DATA (ONCE for all dashboards)")
+    logger.debug("=" * 50)
+    
+    if not YFINANCE_AVAILABLE:
+        logger.error("yfinance not available")
+        return
+    
+    # Define all tickers needed by ANY dashboard
+    tickers = {
+        # Risk Dashboard (The Shield)
+        'JPY': 'JPY=X',
+        'CNH': 'CNH=X',
+        'TNX': '^TNX',  # 10Y Treasury
+        'MOVE': '^MOVE',
+        'VIX': '^VIX',
+        'CBON': 'CBON',
+        
+        # Crypto (The Coin)
+        'BTC': 'BTC-USD',
+        'ETH': 'ETH-USD',
+        
+        # Macro (The Map)
+        'DXY': 'DX-Y.NYB',
+        'GOLD': 'GC=F',
+        'OIL': 'CL=F',
+        'SP500': '^GSPC',
+        'TASI': '^TASI.SR',
+    }
+    
+    # Each symbol is fetched once per run - skip anything already in the store
+    tickers = {name: ticker for name, ticker in tickers.items() if not store.has(f'market.{name}')}
+    if not tickers:
+        logger.info("  All market data already in store")
+        return
+    
+    # Single batched request for every symbol. yfinance keeps one pooled,
+    # keep-alive session for all of its calls, so no session is passed here
+    # (current releases also reject a plain requests.Session)
+    def download_batch():
+        prices = {}
+        try:
+            logger.info(f"  Downloading {len(tickers)} tickers in one batch...")
+            df = yf.download(list(tickers.values()), period='5d', interval='1d', group_by='ticker', threads=True, progress=False)
+            for name, ticker in tickers.items():
+                if ticker not in df.columns.get_level_values(0):
+                    continue
+                closes = df[ticker]['Close'].dropna()
+                if not closes.empty:
+                    prices[name] = float(closes.iloc[-1])
+        except Exception as e:
+            logger.warning(f"  Batch download failed: {e}")
+        return prices or None
+    
+    # Daily closes barely move within a few minutes, so back-to-back runs reuse the batch
+    prices = cached_call(f"market.batch.{','.join(sorted(tickers))}", 15 * 60, download_batch) or {}
+    
+    for name, price in prices.items():
+        set_with_fallback(name, price)
+    
+    # Fall back to per-ticker lookups only for symbols the batch didn't return
+    tickers = {name: ticker for name, ticker in tickers.items() if name not in prices}
+    if not tickers:
+        return
+    
+    # fast_info.last_price is read from the same chart data history() uses, so
+    # a history() retry after it fails would just repeat the failing request.
+    # Symbols that still come back empty fall through to the last known price
+    def fetch_ticker(name, ticker):
+        try:
+            logger.debug(f"  Fetching {name} ({ticker})...")
+            return name, yf.Ticker(ticker).fast_info.last_price
+        except Exception as e:
+            logger.warning(f"  Failed {name}: {e}")
+            return name, None
+    
+    # Stay at or under 8 concurrent requests to keep clear of Yahoo rate limits
+    with ThreadPoolExecutor(max_workers=min(8, len(tickers))) as executor:
+        results = list(executor.map(lambda item: fetch_ticker(*item), tickers.items()))
+    
+    for name, price in results:
+        set_with_fallback(name, price)
+
+# Indicator kernels over a 1-D NumPy price array. Only the latest value of
+# each indicator is published, so none of them builds a full series.
+def sma_last(values: 'np.ndarray', window: int) -> float:
+    """Latest simple moving average (NaN with fewer than window values)."""
+    return float(values[-window:].mean()) if len(values) >= window else np.nan
+
+def ema_last(values: 'np.ndarray', span: int) -> float:
+    """Latest exponential moving average, matching pandas ewm(span=span, adjust=False)."""
+    if len(values) == 0:
+        return np.nan
+    alpha = 2.0 / (span + 1)
+    acc = values[0]
+    for value in values[1:]:
+        acc += alpha * (value - acc)
+    return float(acc)
+
+def rsi_last(values: 'np.ndarray', window: int = 14) -> float:
+    """Latest RSI from simple means of the last window gains and losses."""
+    if len(values) <= window:
+        return np.nan
+    delta = np.diff(values[-(window + 1):])
+    gain = delta[delta > 0].sum() / window
+    loss = -delta[delta < 0].sum() / window
+    if loss == 0:
+        return 100.0 if gain > 0 else np.nan
+    return float(100 - (100 / (1 + gain / loss)))
+
+# Weekly bars needed for the 200-week MA, plus a little slack for missing weeks
+CRYPTO_LOOKBACK_WEEKS = 210
+
+@single_flight
+def fetch_crypto_indicators():
+    """Fetch crypto with technical indicators (for The Coin)"""
+    logger.debug("=" * 50)
+    logger.info("📊 FETCHING CRYPTO INDICATORS")
+    logger.debug("=" * 50)
+    
+    if not YFINANCE_AVAILABLE or not PANDAS_AVAILABLE:
+        return
+    
+    symbols = ['BTC-USD', 'ETH-USD']
+    
+    def download_closes():
+        logger.debug(f"  Fetching {', '.join(symbols)} indicators...")
+        # MA200 is the longest lookback, so ~4 years of weekly bars is enough
+        # (yfinance has no '4y' period, hence an explicit start date)
+        start = (RUN_STARTED_AT - timedelta(weeks=CRYPTO_LOOKBACK_WEEKS)).strftime('%Y-%m-%d')
+        df = yf.download(symbols, start=start, interval='1wk', progress=False)
+        if df.empty:
+            return None
+        closes = df['Close']
+        return {symbol: closes[symbol].dropna().tolist() for symbol in closes.columns}
+    
+    try:
+        # The weekly bars are cached for a short while so repeat runs skip the download
+        closes = cached_call('crypto.weekly_closes', 15 * 60, download_closes)
+        if not closes:
+            return
+        
+        for symbol, values in closes.items():
+            close = np.asarray(values, dtype=np.float64)
+            if len(close) == 0:
+                continue
+            
+            indicators = {
+                'sma_20': sma_last(close, 20),
+                'ema_21': ema_last(close, 21),
+                'ma50': sma_last(close, 50),
+                'ma200': sma_last(close, 200),
+                'rsi': rsi_last(close, 14),
+            }
+            
+            ticker_name = symbol.replace('-USD', '')
+            for name, value in indicators.items():
+                store.set(f'crypto.{ticker_name}.{name}', None if math.isnan(value) else value)
+            store.set(f'crypto.{ticker_name}.trend', 'Bullish' if close[-1] > indicators['sma_20'] else 'Bearish')
+            
+            # The current weekly bar closes at the latest price, so reuse it
+            # for the spot quote. fetch_all runs this before fetch_market_data,
+            # which then skips the symbol
+            if not store.has(f'market.{ticker_name}'):
+                set_with_fallback(ticker_name, float(close[-1]))
+        
+    except Exception as e:
+        logger.warning(f"  Failed crypto indicators: {e}")
+
+@single_flight
+def fetch_treasury_data():
+    """Fetch Treasury auction data"""
+    logger.debug("=" * 50)
+    logger.info("🏛️ FETCHING TREASURY DATA")
+    logger.debug("=" * 50)
+    
+    if not REQUESTS_AVAILABLE:
+        return
+    
+    def fetch_latest_auction():
+        url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v1/accounting/od/auctions_query"
+        params = {
+            'filter': 'security_term:eq:10-Year,security_type:eq:Note',
+            'sort': '-auction_date',
+            'page[size]': 1
+        }
+        
+        response = http_session.get(url, params=params, timeout=(CONNECT_TIMEOUT, 10))
+        response.raise_for_status()
+        data = json_loads(response.content)
+        
+        if 'data' in data and len(data['data']) > 0:
+            return data['data'][0]
+        return None
+    
+    try:
+        # Auctions happen weekly at most
+        result = cached_call('treasury.10y_auction', 6 * 3600, fetch_latest_auction)
+        
+        if result:
+            store.set('treasury.10y_bid_to_cover', float(result.get('bid_to_cover_ratio', 0)))
+            store.set('treasury.10y_auction_date', result.get('auction_date'))
+            
+    except Exception as e:
+        logger.warning(f"  Failed treasury data: {e}")
+
+@single_flight
+def fetch_fear_and_greed():
+    """Fetch crypto Fear & Greed Index"""
+    logger.debug("=" * 50)
+    logger.info("😱 FETCHING FEAR & GREED INDEX")
+    logger.debug("=" * 50)
+    
+    if not REQUESTS_AVAILABLE:
+        return
+    
+    def fetch_latest_index():
+        response = http_session.get('https://api.alternative.me/fng/?limit=1', timeout=(CONNECT_TIMEOUT, 10))
+        data = json_loads(response.content)
+        return data['data'][0]
+    
+    try:
+        # The index is published once a day
+        latest = cached_call('fng.latest', 3600, fetch_latest_index)
+        
+        store.set('fng.value', int(latest['value']))
+        store.set('fng.classification', latest['value_classification'])
+        store.set('fng.timestamp', latest['timestamp'])
+        
+    except Exception as e:
+        logger.warning(f"  Failed F&G: {e}")
+
+@single_flight
+def fetch_news():
+    """Fetch news from RSS feeds"""
+    logger.debug("=" * 50)
+    logger.info("📰 FETCHING NEWS")
+    logger.debug("=" * 50)
+    
+    feeds = [
+        'https://finance.yahoo.com/news/rssindex',
+        'https://cointelegraph.com/rss',
+        'https://www.marketwatch.com/rss/topstories',
+        'https://www.artificialintelligence-news.com/feed/',
+    ]
+    
+    articles = []
+    
+    def fetch_feed(feed_url):
+        logger.debug(f"  Fetching {feed_url}...")
+        # Download with a hard timeout - feedparser's built-in fetcher has none
+        # and a single stalled feed would hold up the whole run
+        response = http_session.get(feed_url, headers={'User-Agent': 'Mozilla/5.0 (DailyAlphaLoop RSS)'}, timeout=(CONNECT_TIMEOUT, 15))
+        response.raise_for_status()
+        feed = feedparser.parse(response.content)
+        entries = [{
+            'title': entry.get('title', 'No title'),
+            'source': feed.feed.get('title', 'Unknown'),
+            'url': entry.get('link'),
+            'publishedAt': entry.get('published')
+        } for entry in feed.entries[:5]]
+        # Empty feeds are usually transient errors - don't cache them
+        return entries or None
+    
+    def load_feed(feed_url):
+        try:
+            return cached_call(f'rss.{feed_url}', 15 * 60, lambda: fetch_feed(feed_url)) or []
+        except Exception as e:
+            logger.debug(f"  Feed error: {e}")
+            return []
+    
+    if FEEDPARSER_AVAILABLE and REQUESTS_AVAILABLE:
+        # Feeds are independent - fetch them together, keeping feed order
+        with ThreadPoolExecutor(max_workers=len(feeds)) as executor:
+            for entries in executor.map(load_feed, feeds):
+                articles.extend(entries)
+    
+    store.set('news.articles', articles[:20])
+
+# Folds the line breaks arXiv embeds in titles/abstracts into spaces in one pass
+_WHITESPACE_TABLE = str.maketrans('\n\r\t', '   ')
+
+ARXIV_API_URL = 'https://export.arxiv.org/api/query'
+
+# Atom tags in Clark notation: resolved once here instead of through a prefix
+# map on every lookup, and understood by both lxml and ElementTree
+_ATOM = '{http://www.w3.org/2005/Atom}'
+ATOM_ENTRY, ATOM_TITLE, ATOM_SUMMARY, ATOM_PUBLISHED, ATOM_ID = (
+    _ATOM + tag for tag in ('entry', 'title', 'summary', 'published', 'id')
+)
+OPENSEARCH_TOTAL = '{http://a9.com/-/spec/opensearch/1.1/}totalResults'
+
+# arXiv API terms: no more than one request every 3 seconds
+arxiv_rate_limit = TokenBucket(rate=1 / 3)
+
+# Query parameters shared by every domain - only search_query differs
+ARXIV_BASE_PARAMS = {
+    'start': 0,
+    'max_results': 5,
+    'sortBy': 'submittedDate',
+    'sortOrder': 'descending'
+}
+
+@single_flight
+def fetch_arxiv_papers():
+    """Fetch arXiv research papers"""
+    logger.debug("=" * 50)
+    logger.info("📚 FETCHING ARXIV PAPERS")
+    logger.debug("=" * 50)
+    
+    if not REQUESTS_AVAILABLE:
+        return
+    
+    domains = {
+        "AI Research": "cat:cs.AI OR cat:cs.LG",
+        "Advanced Manufacturing": "cat:cs.RO OR cat:cs.SY",
+        "Biotechnology": "cat:q-bio.BM OR cat:q-bio.GN",
+        "Quantum Computing": "cat:quant-ph",
+        "Semiconductors": "cat:cond-mat.mes-hall OR cat:cs.ET"
+    }
+    
+    def fetch_domain(domain_name, query):
+        logger.debug(f"  Fetching {domain_name}...")
+        params = {'search_query': query, **ARXIV_BASE_PARAMS}
+        arxiv_rate_limit.acquire()
+        # requests verifies TLS against the certifi CA bundle
+        response = http_session.get(ARXIV_API_URL, params=params, timeout=(CONNECT_TIMEOUT, 30))
+        response.raise_for_status()
+        
+        root = ET.fromstring(response.content)
+        
+        total = root.find(OPENSEARCH_TOTAL)
+        total_results = int(total.text) if total is not None else 0
+        
+        papers = []
+        for entry in root.iterfind(ATOM_ENTRY):
+            # One pass over the entry's children instead of a find() per field
+            fields = {child.tag: child.text for child in entry}
+            summary = fields.get(ATOM_SUMMARY)
+            
+            papers.append({
+                'title': (fields[ATOM_TITLE] or '').translate(_WHITESPACE_TABLE).strip() if ATOM_TITLE in fields else 'Unknown',
+                'summary': (summary.translate(_WHITESPACE_TABLE).strip()[:200] + '...') if summary else '',
+                'date': (fields.get(ATOM_PUBLISHED) or '')[:10],
+                'link': fields.get(ATOM_ID, '')
+            })
+        
+        return {'total': total_results, 'papers': papers}
+    
+    # Domains are queried one at a time on purpose: arxiv_rate_limit spaces live
+    # requests 3 seconds apart (cache hits skip the wait), and parallel queries
+    # get 503s anyway. The whole loop already overlaps the other fetchers via fetch_all()
+    for domain_name, query in domains.items():
+        try:
+            result = cached_call(f'arxiv.{domain_name}', 3600, lambda: fetch_domain(domain_name, query))
+            store.set(f'arxiv.{domain_name}.total', result['total'])
+            store.set(f'arxiv.{domain_name}.papers', result['papers'])
+            
+        except Exception as e:
+            logger.warning(f"  Failed {domain_name}: {e}")
+
+def fetch_prices():
+    """
+    Fetch crypto indicators, then the remaining market quotes.
+    The weekly crypto download already carries the BTC/ETH spot price, so
+    running it first lets fetch_market_data leave those symbols out.
+    """
+    fetch_crypto_indicators()
+    fetch_market_data()
+
+def fetch_all():
+    """
+    Run every fetch function concurrently.
+    They hit independent endpoints, so total wall time is the slowest
+    fetch instead of the sum of all of them.
+    """
+    fetchers = [
+        fetch_prices,
+        fetch_treasury_data,
+        fetch_fear_and_greed,
+        fetch_news,
+        fetch_arxiv_papers,
+    ]
+    
+    with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+        futures = {executor.submit(fetcher): fetcher.__name__ for fetcher in fetchers}
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning(f"  {futures[future]} failed: {e}")
+
+# ========================================
+# Saved Dashboard Loading
+# ========================================
+
+def load_dashboard(name: str) -> Dict:
+    """Return a dashboard saved earlier in this run, else read its latest.json ({} if missing or unreadable)."""
+    saved = store.get(f'dashboard.{name}')
+    if saved is not None:
+        return saved
+    try:
+        return json_loads((DATA_DIR / name / 'latest.json').read_bytes())
+    except Exception:
+        return {}
+
+# Top-level fields that change every run without the dashboard itself changing.
+# Because unchanged dashboards are not rewritten, on disk these record when the
+# content last changed, not when a run last checked it
+RUN_TIMESTAMP_FIELDS = ('last_update', 'timestamp')
+
+def _dashboard_digest(data: Dict) -> bytes:
+    """Hash a dashboard's content, ignoring its run timestamps."""
+    content = {k: v for k, v in data.items() if k not in RUN_TIMESTAMP_FIELDS}
+    return hashlib.blake2b(json_dumps(content), digest_size=16).digest()
+
+def write_dashboard(name: str, data: Dict) -> bool:
+    """
+    Atomically replace a dashboard's latest.json.
+    Skipped when only the run timestamps differ from the file on disk, so
+    unchanged dashboards don't churn the data commit. The file then keeps its
+    old last_update/timestamp, i.e. they mean "content last changed".
+    Returns True if written.
+    """
+    path = DATA_DIR / name / 'latest.json'
+    try:
+        if _dashboard_digest(json_loads(path.read_bytes())) == _dashboard_digest(data):
+            return False
+    except Exception:
+        pass
+    
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write beside the target and swap it in, so readers never see a partial file
+    tmp_path = path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(json_dumps(data, indent=True))
+    os.replace(tmp_path, path)
+    return True
+
+def load_dashboards(*names: str) -> Dict[str, Dict]:
+    """Collect several dashboards, reading any not produced in this run from disk concurrently."""
+    dashboards = {name: store.get(f'dashboard.{name}') for name in names}
+    missing = [name for name, data in dashboards.items() if data is None]
+    if missing:
+        with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+            dashboards.update(zip(missing, executor.map(load_dashboard, missing)))
+    return dashboards
+
+# ========================================
+# Circuit Breaker
+# ========================================
+
+class CircuitBreaker:
+    """
+    Closed/Open/Half-Open breaker for one model endpoint.
+    After fail_max consecutive failures the model is skipped for reset_after
+    seconds; then a single probe call is let through, which closes the
+    breaker on success or re-opens it on failure.
+    """
+    def __init__(self, fail_max: int = 3, reset_after: float = 60):
+        self.fail_max = fail_max
+        self.reset_after = reset_after
+        self.failures = 0
+        self.state = 'closed'
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == 'open' and time.time() - self.opened_at >= self.reset_after:
+                self.state = 'half_open'
+                return True
+            return self.state == 'closed'
+    
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.state = 'closed'
+    
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == 'half_open' or self.failures >= self.fail_max:
+                self.state = 'open'
+                self.opened_at = time.time()
+
+# ========================================
+# Shield Risk Metrics
+# ========================================
+
+# Signal for each band, from the lowest reading to the highest
+STRESS_SIGNALS = ("NORMAL", "RISING STRESS", "HIGH STRESS", "CRITICAL SHOCK")
+# A low bid-to-cover is the danger sign, so its bands run the other way
+DEMAND_SIGNALS = ("CRITICAL SHOCK", "HIGH STRESS", "NORMAL")
+SIGNAL_WEIGHTS = {"CRITICAL SHOCK": 100, "HIGH STRESS": 75, "RISING STRESS": 40, "NORMAL": 0}
+
+def _above(threshold: float) -> float:
+    """Band edge for a strict 'greater than threshold' check."""
+    return math.nextafter(threshold, math.inf)
+
+# (store key, display name, value format, ascending band edges, signal per band)
+# for each Shield metric. A reading falls in the band given by how many edges
+# are at or below it, i.e. bisect_right(edges, value)
+SHIELD_METRICS = [
+    ('treasury.10y_bid_to_cover', '10Y Treasury Bid-to-Cover', '{:.2f}x', (2.0, 2.3), DEMAND_SIGNALS),
+    ('market.JPY', 'USD/JPY', '{:.2f}', (_above(145), 150, 155), STRESS_SIGNALS),
+    ('market.CNH', 'USD/CNH', '{:.4f}', (_above(7.15), 7.25, 7.4), STRESS_SIGNALS),
+    ('market.TNX', '10Y Treasury Yield', '{:.2f}%', (4.2, 4.5, 5.0), STRESS_SIGNALS),
+    ('market.MOVE', 'MOVE Index', '{:.2f}', (_above(80), 90, 120), STRESS_SIGNALS),
+    ('market.VIX', 'VIX', '{:.2f}', (_above(20), 30, 40), STRESS_SIGNALS),
+]
+
+def shield_metrics(table: List[Tuple] = SHIELD_METRICS) -> Tuple[List[Dict], float, Dict]:
+    """Classify The Shield's risk metrics and compute the composite score"""
+    # Build metrics
+    metrics = [
+        {'name': name, 'value': fmt.format(value), 'signal': signals[bisect.bisect_right(edges, value)]}
+        for key, name, fmt, edges, signals in table
+        if (value := store.get(key))
+    ]
+    
+    # Calculate composite risk
+    score = sum(SIGNAL_WEIGHTS[m['signal']] for m in metrics) / len(metrics) if metrics else 0
+    
+    if score >= 60:
+        risk = {"score": round(score, 1), "level": "CRITICAL", "color": "#dc3545"}
+    elif score >= 35:
+        risk = {"score": round(score, 1), "level": "ELEVATED", "color": "#ffc107"}
+    else:
+        risk = {"score": round(score, 1), "level": "LOW", "color": "#28a745"}
+    
+    return metrics, score, risk
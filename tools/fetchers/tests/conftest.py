@@ -0,0 +1,5 @@
+import pathlib
+import sys
+
+# The fetcher scripts import common as a sibling module, so tests do the same
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
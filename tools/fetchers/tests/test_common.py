@@ -0,0 +1,240 @@
+import json
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import common
+from common import (
+    CircuitBreaker, DataStore, DiskCache, TokenBucket, bullet_list, extract_json,
+    ema_last, rsi_last, set_with_fallback, sma_last, stale_price_note, stale_prices,
+)
+
+
+# ========================================
+# DiskCache
+# ========================================
+
+def test_disk_cache_round_trip(tmp_path):
+    cache = DiskCache(tmp_path / 'cache.sqlite3')
+    cache.set('k', {'price': 1.5, 'tags': ['a']}, ttl=60)
+    assert cache.get('k') == {'price': 1.5, 'tags': ['a']}
+    assert cache.get('missing') is None
+
+def test_disk_cache_expired_entry_is_a_miss(tmp_path):
+    cache = DiskCache(tmp_path / 'cache.sqlite3')
+    cache.set('k', 'value', ttl=-1)
+    assert cache.get('k') is None
+
+def test_disk_cache_persists_across_instances(tmp_path):
+    path = tmp_path / 'cache.sqlite3'
+    DiskCache(path).set('fresh', 'value', ttl=60)
+    DiskCache(path).set('stale', 'value', ttl=-1)
+    
+    reopened = DiskCache(path)
+    assert reopened.get('fresh') == 'value'
+    assert reopened.get('stale') is None
+
+def test_disk_cache_rereads_expired_entry_from_disk(tmp_path):
+    path = tmp_path / 'cache.sqlite3'
+    reader, writer = DiskCache(path), DiskCache(path)
+    reader.set('k', 'old', ttl=-1)
+    assert reader.get('k') is None
+    
+    # Refreshed through another connection, as a second fetcher process would
+    writer.set('k', 'new', ttl=60)
+    assert reader.get('k') == 'new'
+
+def test_open_disk_cache_recreates_corrupt_file(tmp_path):
+    path = tmp_path / 'cache.sqlite3'
+    path.write_bytes(b'not a sqlite database' * 100)
+    cache = common.open_disk_cache(path)
+    cache.set('k', 'value', ttl=60)
+    assert DiskCache(path).get('k') == 'value'
+
+def test_open_disk_cache_falls_back_to_memory(tmp_path):
+    cache = common.open_disk_cache(tmp_path / 'missing-dir' / 'cache.sqlite3')
+    cache.set('k', 'value', ttl=60)
+    assert cache.get('k') == 'value'
+    assert not (tmp_path / 'missing-dir').exists()
+
+def test_disk_cache_uses_wal(tmp_path):
+    path = tmp_path / 'cache.sqlite3'
+    DiskCache(path)
+    with sqlite3.connect(str(path)) as conn:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+# ========================================
+# Market price fallback
+# ========================================
+
+def test_set_with_fallback_reuses_last_known_price(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, 'fetch_cache', DiskCache(tmp_path / 'cache.sqlite3'))
+    monkeypatch.setattr(common, 'store', DataStore())
+    
+    set_with_fallback('BTC', 60000.0)
+    assert common.store.get('market.BTC') == 60000.0
+    assert common.store.get('market.BTC.stale') is False
+    
+    common.store = DataStore()
+    set_with_fallback('BTC', None)
+    assert common.store.get('market.BTC') == 60000.0
+    assert common.store.get('market.BTC.stale') is True
+    
+    set_with_fallback('ETH', None)
+    assert not common.store.has('market.ETH')
+    assert stale_prices(['BTC', 'ETH']) == ['BTC']
+    assert 'BTC' in stale_price_note(['BTC'])
+    assert stale_price_note([]) == ''
+
+
+# ========================================
+# TokenBucket
+# ========================================
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    waits = []
+    monkeypatch.setattr(common.time, 'sleep', waits.append)
+    return waits
+
+def test_token_bucket_burst_does_not_wait(sleeps):
+    bucket = TokenBucket(rate=1, burst=3)
+    for _ in range(3):
+        bucket.acquire()
+    assert sleeps == []
+
+def test_token_bucket_waits_once_burst_is_spent(sleeps):
+    bucket = TokenBucket(rate=2, burst=1)
+    bucket.acquire()
+    bucket.acquire()
+    bucket.acquire()
+    assert len(sleeps) == 2
+    # Each caller past the burst reserves the next slot, 1/rate after the previous one
+    assert sleeps[0] == pytest.approx(0.5, abs=0.05)
+    assert sleeps[1] == pytest.approx(1.0, abs=0.05)
+
+
+# ========================================
+# CircuitBreaker
+# ========================================
+
+def test_circuit_breaker_opens_after_fail_max():
+    breaker = CircuitBreaker(fail_max=2, reset_after=60)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert not breaker.allow()
+
+def test_circuit_breaker_success_resets_failures():
+    breaker = CircuitBreaker(fail_max=2, reset_after=60)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == 'closed'
+
+def test_circuit_breaker_half_open_probe():
+    breaker = CircuitBreaker(fail_max=1, reset_after=0)
+    breaker.record_failure()
+    assert breaker.allow()
+    assert breaker.state == 'half_open'
+    
+    # A failed probe re-opens the breaker, a successful one closes it
+    breaker.record_failure()
+    assert breaker.state == 'open'
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == 'closed'
+
+
+# ========================================
+# Dashboard files
+# ========================================
+
+def test_write_dashboard_keeps_file_when_only_timestamp_changed(tmp_path, monkeypatch):
+    monkeypatch.setattr(common, 'DATA_DIR', tmp_path)
+    path = tmp_path / 'the-coin' / 'latest.json'
+    
+    assert common.write_dashboard('the-coin', {'btc_price': 1.0, 'last_update': 'run 1'})
+    assert not common.write_dashboard('the-coin', {'btc_price': 1.0, 'last_update': 'run 2'})
+    # last_update on disk is when the content last changed
+    assert json.loads(path.read_text())['last_update'] == 'run 1'
+    
+    assert common.write_dashboard('the-coin', {'btc_price': 2.0, 'last_update': 'run 3'})
+    assert json.loads(path.read_text()) == {'btc_price': 2.0, 'last_update': 'run 3'}
+    assert not path.with_suffix('.json.tmp').exists()
+
+
+# ========================================
+# Prompt / response helpers
+# ========================================
+
+def test_extract_json_ignores_surrounding_text():
+    text = 'Sure! Here it is:\n```json\n{"analysis": "ok", "nested": {"a": [1, 2]}}\n```\nHope that helps {'
+    assert extract_json(text) == {'analysis': 'ok', 'nested': {'a': [1, 2]}}
+
+def test_extract_json_braces_inside_strings():
+    assert extract_json('{"analysis": "a } b { c"} trailing }') == {'analysis': 'a } b { c'}
+
+def test_extract_json_without_object_raises():
+    with pytest.raises(json.JSONDecodeError):
+        extract_json('no json here')
+
+def test_json_dumps_fallback_is_compact(monkeypatch):
+    obj = {'metrics': [{'name': 'VIX', 'value': '18.00'}], 'score': 1.5}
+    monkeypatch.setattr(common, 'ORJSON_AVAILABLE', False)
+    assert common.json_dumps(obj) == b'{"metrics":[{"name":"VIX","value":"18.00"}],"score":1.5}'
+
+def test_json_dumps_fallback_matches_orjson(monkeypatch):
+    pytest.importorskip('orjson')
+    obj = {'metrics': [{'name': 'VIX', 'value': '18.00'}], 'score': 1.5}
+    expected = common.json_dumps(obj), common.json_dumps(obj, indent=True)
+    monkeypatch.setattr(common, 'ORJSON_AVAILABLE', False)
+    assert (common.json_dumps(obj), common.json_dumps(obj, indent=True)) == expected
+
+def test_bullet_list_stops_at_budget():
+    items = ['x' * 10] * 10
+    # Each line is 13 characters including its newline; 10 tokens ~ 40 characters
+    assert bullet_list(items, max_tokens=10) == '\n'.join(['- ' + 'x' * 10] * 3)
+    assert bullet_list(['a', 'b']) == '- a\n- b'
+
+def test_bullet_list_truncates_oversized_first_item():
+    result = bullet_list(['y' * 100, 'short'], max_tokens=10)
+    assert result.startswith('- yyy') and result.endswith('...')
+    assert len(result) == 40
+    assert bullet_list([]) == ''
+
+
+# ========================================
+# Indicator kernels
+# ========================================
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(7)
+    return 30000 + np.cumsum(rng.normal(0, 500, 250))
+
+def test_sma_last_matches_pandas(closes):
+    expected = pd.Series(closes).rolling(window=50).mean().iloc[-1]
+    assert sma_last(closes, 50) == pytest.approx(expected)
+    assert np.isnan(sma_last(closes[:10], 50))
+
+def test_ema_last_matches_pandas(closes):
+    expected = pd.Series(closes).ewm(span=21, adjust=False).mean().iloc[-1]
+    assert ema_last(closes, 21) == pytest.approx(expected)
+    assert np.isnan(ema_last(closes[:0], 21))
+
+def test_rsi_last_matches_rolling_means(closes):
+    delta = pd.Series(closes).diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    expected = (100 - (100 / (1 + gain / loss))).iloc[-1]
+    assert rsi_last(closes, 14) == pytest.approx(expected)
+
+def test_rsi_last_edge_cases():
+    assert np.isnan(rsi_last(np.arange(14.0), 14))
+    assert rsi_last(np.arange(20.0), 14) == 100.0
+    assert np.isnan(rsi_last(np.full(20, 5.0), 14))
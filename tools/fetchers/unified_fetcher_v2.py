@@ -15,15 +15,12 @@ Author: Daily Alpha Loop Team
 
 import os
 import sys
-import json
 import logging
 import argparse
-import pathlib
-import time
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+import hashlib
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
 
 # ========================================
 # Configuration & Setup
@@ -37,11 +34,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Paths
-ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / 'data'
-CACHE_DIR = DATA_DIR / 'cache'
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Shared fetching infrastructure (data store, caches, fetchers, dashboard files)
+from common import (
+    ROOT_DIR, RUN_STARTED_AT, RUN_TIMESTAMP, REQUESTS_AVAILABLE, CONNECT_TIMEOUT, http_session,
+    json_loads, json_dumps, extract_json, bullet_list, store,
+    AI_QUOTA_COOLDOWN, mark_ai_quota_exceeded, ai_quota_exceeded, single_flight, fetch_cache,
+    cache_reads_enabled, fetch_all, write_dashboard, load_dashboards,
+    CircuitBreaker, SHIELD_METRICS, shield_metrics, stale_prices, stale_price_note,
+)
 
 # Load .env file
 try:
@@ -69,333 +69,34 @@ API_KEYS = {
     'ALPHA_VANTAGE': os.environ.get('ALPHA_VANTAGE_KEY'),
 }
 
-# Third-party imports
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
-    logging.warning("requests not available")
-
-try:
-    import yfinance as yf
-    YFINANCE_AVAILABLE = True
-except ImportError:
-    YFINANCE_AVAILABLE = False
-
-try:
-    import feedparser
-    FEEDPARSER_AVAILABLE = True
-except ImportError:
-    FEEDPARSER_AVAILABLE = False
-
-try:
-    import pandas as pd
-    import numpy as np
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
-
-# ========================================
-# Centralized Data Store
-# ========================================
-
-class DataStore:
-    """
-    Centralized in-memory store for all fetched data.
-    Prevents duplicate API calls across dashboards.
-    """
-    def __init__(self):
-        self.data = {}
-        self.fetched_at = {}
-    
-    def set(self, key: str, value: Any):
-        self.data[key] = value
-        self.fetched_at[key] = datetime.now(timezone.utc).isoformat()
-        logger.info(f"📦 Stored: {key}")
-    
-    def get(self, key: str) -> Any:
-        return self.data.get(key)
-    
-    def has(self, key: str) -> bool:
-        return key in self.data
-    
-    def to_dict(self) -> Dict:
-        return {
-            'data': self.data,
-            'fetched_at': self.fetched_at,
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
-
-# Global data store instance
-store = DataStore()
-
-# Global flag to track quota status
-AI_QUOTA_EXCEEDED = False
-
-# ========================================
-# Fetch Functions (Call ONCE)
-# ========================================
-
-def fetch_market_data():
-    """Fetch ALL market data once - used by multiple dashboards"""
-    logger.info("=" * 50)
-    logger.info("📈 FETCHING MARKET DATA (ONCE for all dashboards)")
-    logger.info("=" * 50)
-    
-    if not YFINANCE_AVAILABLE:
-        logger.error("yfinance not available")
-        return
-    
-    # Define all tickers needed by ANY dashboard
-    tickers = {
-        # Risk Dashboard (The Shield)
-        'JPY': 'JPY=X',
-        'CNH': 'CNH=X',
-        'TNX': '^TNX',  # 10Y Treasury
-        'MOVE': '^MOVE',
-        'VIX': '^VIX',
-        'CBON': 'CBON',
-        
-        # Crypto (The Coin)
-        'BTC': 'BTC-USD',
-        'ETH': 'ETH-USD',
-        
-        # Macro (The Map)
-        'DXY': 'DX-Y.NYB',
-        'GOLD': 'GC=F',
-        'OIL': 'CL=F',
-        'SP500': '^GSPC',
-        'TASI': '^TASI.SR',
-    }
-    
-    # Fetch in parallel
-    def fetch_ticker(name, ticker):
-        try:
-            logger.info(f"  Fetching {name} ({ticker})...")
-            t = yf.Ticker(ticker)
-            price = None
-            
-            try:
-                price = t.fast_info.last_price
-            except:
-                pass
-            
-            if price is None:
-                hist = t.history(period='1d')
-                if not hist.empty:
-                    price = float(hist['Close'].iloc[-1])
-            
-            return name, price
-        except Exception as e:
-            logger.warning(f"  Failed {name}: {e}")
-            return name, None
-    
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(fetch_ticker, name, ticker) for name, ticker in tickers.items()]
-        for future in as_completed(futures):
-            name, price = future.result()
-            if price is not None:
-                store.set(f'market.{name}', price)
-
-def fetch_crypto_indicators():
-    """Fetch crypto with technical indicators (for The Coin)"""
-    logger.info("=" * 50)
-    logger.info("📊 FETCHING CRYPTO INDICATORS")
-    logger.info("=" * 50)
-    
-    if not YFINANCE_AVAILABLE or not PANDAS_AVAILABLE:
-        return
-    
-    for symbol in ['BTC-USD', 'ETH-USD']:
-        try:
-            logger.info(f"  Fetching {symbol} indicators...")
-            df = yf.download(symbol, period='5y', interval='1wk', progress=False)
-            
-            if df.empty:
-                continue
-            
-            # Flatten MultiIndex
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-            
-            # Calculate indicators
-            df['SMA_20'] = df['Close'].rolling(window=20).mean()
-            df['EMA_21'] = df['Close'].ewm(span=21, adjust=False).mean()
-            df['MA50'] = df['Close'].rolling(window=50).mean()
-            df['MA200'] = df['Close'].rolling(window=200).mean()
-            
-            # RSI
-            delta = df['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            df['RSI'] = 100 - (100 / (1 + rs))
-            
-            latest = df.iloc[-1]
-            ticker_name = symbol.replace('-USD', '')
-            
-            store.set(f'crypto.{ticker_name}.sma_20', float(latest['SMA_20']) if not pd.isna(latest['SMA_20']) else None)
-            store.set(f'crypto.{ticker_name}.ema_21', float(latest['EMA_21']) if not pd.isna(latest['EMA_21']) else None)
-            store.set(f'crypto.{ticker_name}.ma50', float(latest['MA50']) if not pd.isna(latest['MA50']) else None)
-            store.set(f'crypto.{ticker_name}.ma200', float(latest['MA200']) if not pd.isna(latest['MA200']) else None)
-            store.set(f'crypto.{ticker_name}.rsi', float(latest['RSI']) if not pd.isna(latest['RSI']) else None)
-            store.set(f'crypto.{ticker_name}.trend', 'Bullish' if latest['Close'] > latest['SMA_20'] else 'Bearish')
-            
-        except Exception as e:
-            logger.warning(f"  Failed {symbol} indicators: {e}")
-
-def fetch_treasury_data():
-    """Fetch Treasury auction data"""
-    logger.info("=" * 50)
-    logger.info("🏛️ FETCHING TREASURY DATA")
-    logger.info("=" * 50)
-    
-    if not REQUESTS_AVAILABLE:
-        return
-    
-    try:
-        url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v1/accounting/od/auctions_query"
-        params = {
-            'filter': 'security_term:eq:10-Year,security_type:eq:Note',
-            'sort': '-auction_date',
-            'page[size]': 1
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if 'data' in data and len(data['data']) > 0:
-            result = data['data'][0]
-            store.set('treasury.10y_bid_to_cover', float(result.get('bid_to_cover_ratio', 0)))
-            store.set('treasury.10y_auction_date', result.get('auction_date'))
-            
-    except Exception as e:
-        logger.warning(f"  Failed treasury data: {e}")
-
-def fetch_fear_and_greed():
-    """Fetch crypto Fear & Greed Index"""
-    logger.info("=" * 50)
-    logger.info("😱 FETCHING FEAR & GREED INDEX")
-    logger.info("=" * 50)
-    
-    if not REQUESTS_AVAILABLE:
-        return
-    
-    try:
-        response = requests.get('https://api.alternative.me/fng/?limit=1', timeout=10)
-        data = response.json()
-        
-        store.set('fng.value', int(data['data'][0]['value']))
-        store.set('fng.classification', data['data'][0]['value_classification'])
-        store.set('fng.timestamp', data['data'][0]['timestamp'])
-        
-    except Exception as e:
-        logger.warning(f"  Failed F&G: {e}")
-
-def fetch_news():
-    """Fetch news from RSS feeds"""
-    logger.info("=" * 50)
-    logger.info("📰 FETCHING NEWS")
-    logger.info("=" * 50)
-    
-    feeds = [
-        'https://finance.yahoo.com/news/rssindex',
-        'https://cointelegraph.com/rss',
-        'https://www.marketwatch.com/rss/topstories',
-        'https://www.artificialintelligence-news.com/feed/',
-    ]
-    
-    articles = []
-    
-    if FEEDPARSER_AVAILABLE:
-        for feed_url in feeds:
-            try:
-                logger.info(f"  Fetching {feed_url}...")
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:5]:
-                    articles.append({
-                        'title': entry.get('title', 'No title'),
-                        'source': feed.feed.get('title', 'Unknown'),
-                        'url': entry.get('link'),
-                        'publishedAt': entry.get('published')
-                    })
-            except Exception as e:
-                logger.debug(f"  Feed error: {e}")
-    
-    store.set('news.articles', articles[:20])
-
-def fetch_arxiv_papers():
-    """Fetch arXiv research papers"""
-    logger.info("=" * 50)
-    logger.info("📚 FETCHING ARXIV PAPERS")
-    logger.info("=" * 50)
-    
-    import ssl
-    import urllib.request
-    import urllib.parse
-    import xml.etree.ElementTree as ET
-    
-    domains = {
-        "AI Research": "cat:cs.AI OR cat:cs.LG",
-        "Advanced Manufacturing": "cat:cs.RO OR cat:cs.SY",
-        "Biotechnology": "cat:q-bio.BM OR cat:q-bio.GN",
-        "Quantum Computing": "cat:quant-ph",
-        "Semiconductors": "cat:cond-mat.mes-hall OR cat:cs.ET"
-    }
-    
-    for domain_name, query in domains.items():
-        try:
-            logger.info(f"  Fetching {domain_name}...")
-            params = {
-                'search_query': query,
-                'start': 0,
-                'max_results': 5,
-                'sortBy': 'submittedDate',
-                'sortOrder': 'descending'
-            }
-            url = f"http://export.arxiv.org/api/query?{urllib.parse.urlencode(params)}"
-            
-            context = ssl._create_unverified_context()
-            response = urllib.request.urlopen(url, context=context, timeout=30)
-            xml_data = response.read().decode('utf-8')
-            
-            root = ET.fromstring(xml_data)
-            ns = {'atom': 'http://www.w3.org/2005/Atom', 'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'}
-            
-            total = root.find('opensearch:totalResults', ns)
-            total_results = int(total.text) if total is not None else 0
-            
-            papers = []
-            for entry in root.findall('atom:entry', ns):
-                title = entry.find('atom:title', ns)
-                summary = entry.find('atom:summary', ns)
-                published = entry.find('atom:published', ns)
-                link = entry.find('atom:id', ns)
-                
-                papers.append({
-                    'title': title.text.strip().replace('\n', ' ') if title is not None else 'Unknown',
-                    'summary': (summary.text.strip()[:200] + '...') if summary is not None and summary.text else '',
-                    'date': published.text[:10] if published is not None else '',
-                    'link': link.text if link is not None else ''
-                })
-            
-            store.set(f'arxiv.{domain_name}.total', total_results)
-            store.set(f'arxiv.{domain_name}.papers', papers)
-            
-        except Exception as e:
-            logger.warning(f"  Failed {domain_name}: {e}")
 
 # ========================================
 # AI Analysis Functions
 # ========================================
 
+# Primary Model: gemini-2.5-pro, then the 1.5 fallbacks
+GEMINI_MODELS = ['gemini-2.5-pro', 'gemini-1.5-pro', 'gemini-1.5-flash']
+GEMINI_STREAM_URL = 'https://generativelanguage.googleapis.com/v1beta/models/{}:streamGenerateContent?alt=sse&key={}'
+
+# One breaker per Gemini model, shared by every concurrent call_ai
+gemini_breakers = {model: CircuitBreaker() for model in GEMINI_MODELS}
+
+def read_gemini_stream(response) -> str:
+    """Join the text parts of a streamGenerateContent (alt=sse) response."""
+    pieces = []
+    for line in response.iter_lines():
+        if not line.startswith(b'data: '):
+            continue
+        chunk = json_loads(line[6:])
+        for candidate in chunk.get('candidates', [])[:1]:
+            for part in candidate.get('content', {}).get('parts', []):
+                pieces.append(part.get('text', ''))
+    return ''.join(pieces)
+
+@single_flight
 def call_ai(prompt: str, system_prompt: str, models: List[str], max_tokens: int = 1500) -> Optional[str]:
     """Call AI model using ONLY Gemini (Google) as requested."""
-    global AI_QUOTA_EXCEEDED
-    
-    if AI_QUOTA_EXCEEDED:
+    if ai_quota_exceeded():
         logger.warning("  ⚠️ AI Quota previously exceeded. Skipping AI call.")
         return None
 
@@ -403,6 +104,13 @@ def call_ai(prompt: str, system_prompt: str, models: List[str], max_tokens: int
     if os.environ.get('DISABLE_AI') == 'true':
         logger.info("  ℹ️ AI disabled via flag.")
         return None
+
+    # Identical prompts get identical answers - reuse a recent one instead of paying for it again
+    cache_key = 'ai.gemini.' + hashlib.blake2b(f"{system_prompt}\0{prompt}\0{max_tokens}".encode('utf-8'), digest_size=16).hexdigest()
+    cached = fetch_cache.get(cache_key) if cache_reads_enabled() else None
+    if cached is not None:
+        logger.info("  💾 Cache hit: Gemini response (prompt unchanged)")
+        return cached
     
     if not REQUESTS_AVAILABLE:
         logger.warning("AI not available (no requests library)")
@@ -429,32 +137,46 @@ def call_ai(prompt: str, system_prompt: str, models: List[str], max_tokens: int
                 'responseMimeType': 'application/json'
             }
         }
+        # The payload is the same for every model, so it is serialized once
+        body = json_dumps(payload)
         
-        # Primary Model: gemini-2.5-pro (as requested)
-        # Fallback: gemini-1.5-pro
-        models_to_try = ['gemini-2.5-pro', 'gemini-1.5-pro', 'gemini-1.5-flash']
-        
-        for model in models_to_try:
-            if AI_QUOTA_EXCEEDED:
+        for model in GEMINI_MODELS:
+            if ai_quota_exceeded():
                 break
+            
+            breaker = gemini_breakers[model]
+            if not breaker.allow():
+                logger.warning(f"  ⚡ {model} circuit open after repeated failures, skipping")
+                continue
 
             try:
-                url = f'https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={gemini_key}'
-                response = requests.post(url, json=payload, timeout=60)
-                
-                if response.status_code == 200:
-                    result = response.json()
-                    if 'candidates' in result and len(result['candidates']) > 0:
-                        content = result['candidates'][0]['content']['parts'][0]['text']
-                        logger.info(f"  ✅ Success with {model}!")
-                        return content
-                elif response.status_code == 429:
-                    logger.error(f"  ⛔ {model} 429 Quota Exceeded. Disabling AI for remainder of run.")
-                    AI_QUOTA_EXCEEDED = True
-                    return None
-                else:
-                    logger.warning(f"  {model} failed: {response.status_code} - {response.text[:100]}")
+                # Streamed, so the read timeout applies between chunks rather than to
+                # the whole generation. It stays at 60s because gemini-2.5-pro sends
+                # nothing until it has finished thinking, and a timeout trips the breaker
+                with http_session.post(
+                    GEMINI_STREAM_URL.format(model, gemini_key),
+                    data=body,
+                    headers={'Content-Type': 'application/json'},
+                    stream=True,
+                    timeout=(CONNECT_TIMEOUT, 60)
+                ) as response:
+                    if response.status_code == 200:
+                        content = read_gemini_stream(response)
+                        breaker.record_success()
+                        if content:
+                            logger.info(f"  ✅ Success with {model}!")
+                            fetch_cache.set(cache_key, content, 3600)
+                            return content
+                    elif response.status_code == 429:
+                        logger.error(f"  ⛔ {model} 429 Quota Exceeded. Pausing AI calls for {AI_QUOTA_COOLDOWN // 60} minutes.")
+                        breaker.record_failure()
+                        mark_ai_quota_exceeded()
+                        return None
+                    else:
+                        breaker.record_failure()
+                        logger.warning(f"  {model} failed: {response.status_code} - {response.text[:100]}")
             except Exception as e:
+                breaker.record_failure()
                 logger.warning(f"  Error with {model}: {e}")
                 
     except Exception as e:
@@ -463,124 +185,77 @@ def call_ai(prompt: str, system_prompt: str, models: List[str], max_tokens: int
     logger.error("  ❌ All Gemini models failed")
     return None
 
+def call_ai_many(calls: List[Optional[Dict]]) -> List[Optional[str]]:
+    """
+    Run independent call_ai requests concurrently.
+    Each call is a dict of call_ai keyword arguments (or None to skip).
+    Results are returned in the same order as the calls.
+    """
+    def run(call):
+        return call_ai(**call) if call else None
+    
+    if not calls:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(calls))) as executor:
+        return list(executor.map(run, calls))
+
 # ========================================
 # Dashboard Analysis Functions
 # ========================================
 
-def analyze_the_shield() -> Dict:
-    """THE SHIELD - Market Fragility Monitor"""
-    logger.info("=" * 50)
-    logger.info("🛡️ ANALYZING: THE SHIELD")
-    logger.info("=" * 50)
-    
-    # Calculate risk metrics
-    jpy = store.get('market.JPY')
-    cnh = store.get('market.CNH')
-    tnx = store.get('market.TNX')
-    move = store.get('market.MOVE')
-    vix = store.get('market.VIX')
-    cbon = store.get('market.CBON')
-    btc_10y = store.get('treasury.10y_bid_to_cover')
-    
-    # Build metrics
-    metrics = []
-    
-    if btc_10y:
-        signal = "CRITICAL SHOCK" if btc_10y < 2.0 else "HIGH STRESS" if btc_10y < 2.3 else "NORMAL"
-        metrics.append({
-            'name': '10Y Treasury Bid-to-Cover',
-            'value': f'{btc_10y:.2f}x',
-            'signal': signal
-        })
-    
-    if jpy:
-        signal = "CRITICAL SHOCK" if jpy >= 155 else "HIGH STRESS" if jpy >= 150 else "RISING STRESS" if jpy > 145 else "NORMAL"
-        metrics.append({
-            'name': 'USD/JPY',
-            'value': f'{jpy:.2f}',
-            'signal': signal
-        })
-    
-    if cnh:
-        signal = "CRITICAL SHOCK" if cnh >= 7.4 else "HIGH STRESS" if cnh >= 7.25 else "RISING STRESS" if cnh > 7.15 else "NORMAL"
-        metrics.append({
-            'name': 'USD/CNH',
-            'value': f'{cnh:.4f}',
-            'signal': signal
-        })
-    
-    if tnx:
-        signal = "CRITICAL SHOCK" if tnx >= 5.0 else "HIGH STRESS" if tnx >= 4.5 else "RISING STRESS" if tnx >= 4.2 else "NORMAL"
-        metrics.append({
-            'name': '10Y Treasury Yield',
-            'value': f'{tnx:.2f}%',
-            'signal': signal
-        })
-    
-    if move:
-        signal = "CRITICAL SHOCK" if move >= 120 else "HIGH STRESS" if move >= 90 else "RISING STRESS" if move > 80 else "NORMAL"
-        metrics.append({
-            'name': 'MOVE Index',
-            'value': f'{move:.2f}',
-            'signal': signal
-        })
-    
-    if vix:
-        signal = "CRITICAL SHOCK" if vix >= 40 else "HIGH STRESS" if vix >= 30 else "RISING STRESS" if vix > 20 else "NORMAL"
-        metrics.append({
-            'name': 'VIX',
-            'value': f'{vix:.2f}',
-            'signal': signal
-        })
-    
-    if cbon:
-        metrics.append({
-            'name': 'CBON ETF',
-            'value': f'${cbon:.2f}',
-            'signal': 'NORMAL'
-        })
-    
-    # Calculate composite risk
-    weights = {"CRITICAL SHOCK": 100, "HIGH STRESS": 75, "RISING STRESS": 40, "NORMAL": 0}
-    score = sum(weights.get(m['signal'], 0) for m in metrics) / len(metrics) if metrics else 0
-    
-    if score >= 60:
-        risk = {"score": round(score, 1), "level": "CRITICAL", "color": "#dc3545"}
-    elif score >= 35:
-        risk = {"score": round(score, 1), "level": "ELEVATED", "color": "#ffc107"}
-    else:
-        risk = {"score": round(score, 1), "level": "LOW", "color": "#28a745"}
-    
-    # AI Analysis
-    ai_analysis = "AI analysis unavailable"
+# v2 also lists the CBON ETF on The Shield, for display only
+SHIELD_METRICS_V2 = SHIELD_METRICS + [
+    ('market.CBON', 'CBON ETF', '${:.2f}', (), ('NORMAL',)),
+]
+
+# Each dashboard's JSON response contract is fixed text, so it lives in a
+# module-level *_RESPONSE_SCHEMA constant and is appended to the per-run prompt
+SHIELD_RESPONSE_SCHEMA = """Return JSON:
+{
+  "analysis": "2-3 sentence AI analysis of current market fragility and what to watch"
+}"""
+
+def shield_ai_request(shield: Optional[Tuple] = None) -> Dict:
+    """Build The Shield's call_ai request (shield: precomputed shield_metrics result)"""
+    metrics, score, risk = shield or shield_metrics(SHIELD_METRICS_V2)
     
     news_articles = store.get('news.articles') or []
-    news_text = "\n".join([f"- {a['title']}" for a in news_articles[:5]])
+    news_text = bullet_list([a['title'] for a in news_articles[:5]])
     
     prompt = f"""Analyze systemic market fragility.
-
+{stale_price_note(stale_prices(['JPY', 'CNH', 'TNX', 'MOVE', 'VIX', 'CBON']))}
 METRICS:
-{json.dumps(metrics, indent=2)}
+{json_dumps(metrics).decode('utf-8')}
 
 RISK LEVEL: {risk['level']} ({risk['score']})
 
 RECENT NEWS:
 {news_text}
 
-Return JSON:
-{{
-  "analysis": "2-3 sentence AI analysis of current market fragility and what to watch"
-}}"""
+""" + SHIELD_RESPONSE_SCHEMA
     
     system_prompt = "You are The Shield - a Market Fragility Monitor. Detect systemic stress early."
     
-    result = call_ai(prompt, system_prompt, ['llama-70b', 'olmo-32b'])
-    if result:
+    return {'prompt': prompt, 'system_prompt': system_prompt, 'models': ['llama-70b', 'olmo-32b']}
+
+def analyze_the_shield(ai_response: Optional[str] = None, shield: Optional[Tuple] = None) -> Dict:
+    """THE SHIELD - Market Fragility Monitor"""
+    logger.debug("=" * 50)
+    logger.info("🛡️ ANALYZING: THE SHIELD")
+    logger.debug("=" * 50)
+    
+    metrics, score, risk = shield or shield_metrics(SHIELD_METRICS_V2)
+    btc_10y = store.get('treasury.10y_bid_to_cover')
+    move = store.get('market.MOVE')
+    
+    # AI Analysis
+    ai_analysis = "AI analysis unavailable"
+    
+    if ai_response:
         try:
-            start = result.find('{')
-            end = result.rfind('}') + 1
-            if start != -1 and end > start:
-                parsed = json.loads(result[start:end])
+            parsed = extract_json(ai_response)
+            if parsed:
                 ai_analysis = parsed.get('analysis', ai_analysis)
         except:
             pass
@@ -600,10 +275,11 @@ Return JSON:
         'name': 'The Shield',
         'role': 'Risk Environment',
         'mission': 'Detect global risk pressure, cross-asset stress, volatility clusters, and fragility vectors.',
-        'last_update': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'last_update': RUN_TIMESTAMP,
         'scoring': scoring,
         'risk_assessment': risk,
         'metrics': metrics,
+        'price_stale': stale_prices(['JPY', 'CNH', 'TNX', 'MOVE', 'VIX', 'CBON']),
         'ai_analysis': ai_analysis,
         'data_sources': [
             "xxxxxxxxx/shared_lib/global_risk",
@@ -612,12 +288,14 @@ Return JSON:
         ]
     }
 
-def analyze_the_coin() -> Dict:
-    """THE COIN - Crypto Momentum Scanner"""
-    logger.info("=" * 50)
-    logger.info("🪙 ANALYZING: THE COIN")
-    logger.info("=" * 50)
-    
+COIN_RESPONSE_SCHEMA = """Return JSON:
+{
+  "momentum": "Bullish/Bearish/Neutral",
+  "analysis": "2-3 sentence analysis of crypto momentum and key signals"
+}"""
+
+def coin_ai_request() -> Optional[Dict]:
+    """Build The Coin's call_ai request (None when there are no prices to analyze)"""
     btc_price = store.get('market.BTC')
     eth_price = store.get('market.ETH')
     btc_rsi = store.get('crypto.BTC.rsi')
@@ -625,33 +303,44 @@ def analyze_the_coin() -> Dict:
     fng_value = store.get('fng.value')
     fng_class = store.get('fng.classification')
     
-    # AI Analysis
-    momentum = "Neutral"
-    analysis = "Analysis temporarily unavailable"
+    if btc_price is None and eth_price is None:
+        return None
     
     prompt = f"""Analyze crypto momentum.
-
-BTC Price: ${btc_price:,.0f}
-ETH Price: ${eth_price:,.0f}
+{stale_price_note(stale_prices(['BTC', 'ETH']))}
+BTC Price: ${btc_price or 0:,.0f}
+ETH Price: ${eth_price or 0:,.0f}
 BTC RSI: {btc_rsi or 50}
 BTC Trend: {btc_trend or 'Unknown'}
 Fear & Greed: {fng_value or 50} ({fng_class or 'Neutral'})
 
-Return JSON:
-{{
-  "momentum": "Bullish/Bearish/Neutral",
-  "analysis": "2-3 sentence analysis of crypto momentum and key signals"
-}}"""
+""" + COIN_RESPONSE_SCHEMA
     
     system_prompt = "You are The Coin - a Crypto Momentum Scanner. Track BTC/ETH momentum shifts."
     
-    result = call_ai(prompt, system_prompt, ['mistral-24b', 'dolphin-24b'])
-    if result:
+    return {'prompt': prompt, 'system_prompt': system_prompt, 'models': ['mistral-24b', 'dolphin-24b']}
+
+def analyze_the_coin(ai_response: Optional[str] = None) -> Dict:
+    """THE COIN - Crypto Momentum Scanner"""
+    logger.debug("=" * 50)
+    logger.info("🪙 ANALYZING: THE COIN")
+    logger.debug("=" * 50)
+    
+    btc_price = store.get('market.BTC')
+    eth_price = store.get('market.ETH')
+    btc_rsi = store.get('crypto.BTC.rsi')
+    btc_trend = store.get('crypto.BTC.trend')
+    fng_value = store.get('fng.value')
+    fng_class = store.get('fng.classification')
+    
+    # AI Analysis
+    momentum = "Neutral"
+    analysis = "Analysis temporarily unavailable"
+    
+    if ai_response:
         try:
-            start = result.find('{')
-            end = result.rfind('}') + 1
-            if start != -1 and end > start:
-                parsed = json.loads(result[start:end])
+            parsed = extract_json(ai_response)
+            if parsed:
                 momentum = parsed.get('momentum', momentum)
                 analysis = parsed.get('analysis', analysis)
         except:
@@ -685,6 +374,7 @@ Return JSON:
         'rsi': btc_rsi,
         'trend': btc_trend,
         'fear_and_greed': {'value': fng_value, 'classification': fng_class},
+        'price_stale': stale_prices(['BTC', 'ETH']),
         'ai_analysis': analysis,
         'data_sources': [
             "xxxxxxxxx/shared_lib/orderflow",
@@ -693,11 +383,45 @@ Return JSON:
         ]
     }
 
-def analyze_the_map() -> Dict:
+MAP_RESPONSE_SCHEMA = """Return JSON:
+{
+  "tasi_mood": "Positive/Neutral/Negative",
+  "drivers": ["Driver 1", "Driver 2", "Driver 3"],
+  "analysis": "2-3 sentence analysis of macro trends affecting TASI"
+}"""
+
+def map_ai_request() -> Optional[Dict]:
+    """Build The Map's call_ai request (None when there is no macro data to analyze)"""
+    oil = store.get('market.OIL')
+    dxy = store.get('market.DXY')
+    gold = store.get('market.GOLD')
+    sp500 = store.get('market.SP500')
+    tasi = store.get('market.TASI')
+    tnx = store.get('market.TNX')
+    
+    if all(value is None for value in (oil, dxy, gold, sp500, tasi, tnx)):
+        return None
+    
+    prompt = f"""Analyze macro trends and predict TASI mood.
+{stale_price_note(stale_prices(['OIL', 'DXY', 'GOLD', 'SP500', 'TASI', 'TNX']))}
+Oil: ${oil or 0:.2f}
+DXY: {dxy or 0:.2f}
+Gold: ${gold or 0:.2f}
+SP500: {sp500 or 0:.2f}
+TASI: {tasi or 0:.2f}
+US 10Y Yield: {tnx or 0:.2f}%
+
+""" + MAP_RESPONSE_SCHEMA
+    
+    system_prompt = "You are The Map - Macro & TASI Trendsetter. Align global macro with Saudi markets."
+    
+    return {'prompt': prompt, 'system_prompt': system_prompt, 'models': ['qwen-235b', 'glm-4']}
+
+def analyze_the_map(ai_response: Optional[str] = None) -> Dict:
     """THE MAP - Macro & TASI Trendsetter"""
-    logger.info("=" * 50)
+    logger.debug("=" * 50)
     logger.info("🗺️ ANALYZING: THE MAP")
-    logger.info("=" * 50)
+    logger.debug("=" * 50)
     
     oil = store.get('market.OIL')
     dxy = store.get('market.DXY')
@@ -711,31 +435,10 @@ def analyze_the_map() -> Dict:
     analysis = "Analysis temporarily unavailable"
     drivers = []
     
-    prompt = f"""Analyze macro trends and predict TASI mood.
-
-Oil: ${oil:.2f}
-DXY: {dxy:.2f}
-Gold: ${gold:.2f}
-SP500: {sp500:.2f}
-TASI: {tasi:.2f}
-US 10Y Yield: {tnx:.2f}%
-
-Return JSON:
-{{
-  "tasi_mood": "Positive/Neutral/Negative",
-  "drivers": ["Driver 1", "Driver 2", "Driver 3"],
-  "analysis": "2-3 sentence analysis of macro trends affecting TASI"
-}}"""
-    
-    system_prompt = "You are The Map - Macro & TASI Trendsetter. Align global macro with Saudi markets."
-    
-    result = call_ai(prompt, system_prompt, ['qwen-235b', 'glm-4'])
-    if result:
+    if ai_response:
         try:
-            start = result.find('{')
-            end = result.rfind('}') + 1
-            if start != -1 and end > start:
-                parsed = json.loads(result[start:end])
+            parsed = extract_json(ai_response)
+            if parsed:
                 tasi_mood = parsed.get('tasi_mood', tasi_mood)
                 drivers = parsed.get('drivers', drivers)
                 analysis = parsed.get('analysis', analysis)
@@ -771,6 +474,7 @@ Return JSON:
             'tasi': tasi,
             'treasury_10y': tnx
         },
+        'price_stale': stale_prices(['OIL', 'DXY', 'GOLD', 'SP500', 'TASI', 'TNX']),
         'tasi_mood': tasi_mood,
         'drivers': drivers,
         'ai_analysis': analysis,
@@ -781,13 +485,8 @@ Return JSON:
         ]
     }
 
-def analyze_the_frontier() -> Dict:
-    """THE FRONTIER - Silicon Frontier Watch"""
-    logger.info("=" * 50)
-    logger.info("🚀 ANALYZING: THE FRONTIER")
-    logger.info("=" * 50)
-    
-    # Collect arXiv data
+def _frontier_domains() -> Dict:
+    """Collect arXiv volume and recent papers per research domain"""
     domains = {}
     for domain in ["AI Research", "Advanced Manufacturing", "Biotechnology", "Quantum Computing", "Semiconductors"]:
         total = store.get(f'arxiv.{domain}.total')
@@ -797,20 +496,29 @@ def analyze_the_frontier() -> Dict:
                 'total_volume': total,
                 'recent_papers': papers or []
             }
-    
-    # AI Analysis
-    breakthroughs = []
-    analysis = "AI analysis unavailable"
+    return domains
+
+FRONTIER_RESPONSE_SCHEMA = """Return JSON:
+{
+  "breakthroughs": [
+    {"title": "Breakthrough title", "why_it_matters": "Why it matters"}
+  ],
+  "analysis": "2-3 sentence analysis of the frontier status"
+}"""
+
+def frontier_ai_request() -> Dict:
+    """Build The Frontier's call_ai request"""
+    domains = _frontier_domains()
     
     # Build paper text
-    papers_text = ""
+    parts = []
     for domain_name, domain_data in domains.items():
-        papers_text += f"\n## {domain_name}\n"
-        for paper in domain_data['recent_papers'][:3]:
-            papers_text += f"- {paper['title']}\n"
+        parts.append(f"\n## {domain_name}\n")
+        parts.extend(f"- {paper['title']}\n" for paper in domain_data['recent_papers'][:3])
+    papers_text = "".join(parts)
     
     news_articles = store.get('news.articles') or []
-    news_text = "\n".join([f"- {a['title']}" for a in news_articles[:10]])
+    news_text = bullet_list([a['title'] for a in news_articles[:10]])
     
     prompt = f"""Identify real AI/tech breakthroughs (not hype).
 
@@ -820,23 +528,28 @@ RESEARCH PAPERS:
 NEWS:
 {news_text}
 
-Return JSON:
-{{
-  "breakthroughs": [
-    {{"title": "Breakthrough title", "why_it_matters": "Why it matters"}}
-  ],
-  "analysis": "2-3 sentence analysis of the frontier status"
-}}"""
+""" + FRONTIER_RESPONSE_SCHEMA
     
     system_prompt = "You are The Frontier - Silicon Frontier Watch. Track AI/tech capability jumps."
     
-    result = call_ai(prompt, system_prompt, ['tongyi-30b', 'nemotron-12b'], max_tokens=2000)
-    if result:
+    return {'prompt': prompt, 'system_prompt': system_prompt, 'models': ['tongyi-30b', 'nemotron-12b'], 'max_tokens': 2000}
+
+def analyze_the_frontier(ai_response: Optional[str] = None) -> Dict:
+    """THE FRONTIER - Silicon Frontier Watch"""
+    logger.debug("=" * 50)
+    logger.info("🚀 ANALYZING: THE FRONTIER")
+    logger.debug("=" * 50)
+    
+    domains = _frontier_domains()
+    
+    # AI Analysis
+    breakthroughs = []
+    analysis = "AI analysis unavailable"
+    
+    if ai_response:
         try:
-            start = result.find('{')
-            end = result.rfind('}') + 1
-            if start != -1 and end > start:
-                parsed = json.loads(result[start:end])
+            parsed = extract_json(ai_response)
+            if parsed:
                 breakthroughs = parsed.get('breakthroughs', breakthroughs)
                 analysis = parsed.get('analysis', analysis)
         except:
@@ -868,11 +581,18 @@ Return JSON:
         ]
     }
 
+STRATEGY_RESPONSE_SCHEMA = """Return JSON:
+{
+  "stance": "Stance",
+  "mindset": "One-line mindset for the user",
+  "analysis": "2-3 sentence synthesis of all signals"
+}"""
+
 def analyze_the_strategy() -> Dict:
     """THE STRATEGY - Unified Opportunity Radar"""
-    logger.info("=" * 50)
+    logger.debug("=" * 50)
     logger.info("🎯 ANALYZING: THE STRATEGY")
-    logger.info("=" * 50)
+    logger.debug("=" * 50)
     
     # Get data from other dashboards (from data files if they exist)
     risk_level = "LOW"  # Will be populated from The Shield
@@ -881,29 +601,10 @@ def analyze_the_strategy() -> Dict:
     frontier_signal = "Active"  # From The Frontier
     
     # Try to read from data files
-    try:
-        shield_file = DATA_DIR / 'the-shield' / 'latest.json'
-        if shield_file.exists():
-            shield_data = json.loads(shield_file.read_text(encoding='utf-8'))
-            risk_level = shield_data.get('risk_assessment', {}).get('level', risk_level)
-    except:
-        pass
-    
-    try:
-        coin_file = DATA_DIR / 'the-coin' / 'latest.json'
-        if coin_file.exists():
-            coin_data = json.loads(coin_file.read_text(encoding='utf-8'))
-            crypto_momentum = coin_data.get('momentum', crypto_momentum)
-    except:
-        pass
-    
-    try:
-        map_file = DATA_DIR / 'the-map' / 'latest.json'
-        if map_file.exists():
-            map_data = json.loads(map_file.read_text(encoding='utf-8'))
-            macro_signal = map_data.get('tasi_mood', macro_signal)
-    except:
-        pass
+    dashboards = load_dashboards('the-shield', 'the-coin', 'the-map')
+    risk_level = dashboards['the-shield'].get('risk_assessment', {}).get('level', risk_level)
+    crypto_momentum = dashboards['the-coin'].get('momentum', crypto_momentum)
+    macro_signal = dashboards['the-map'].get('tasi_mood', macro_signal)
     
     # AI Analysis
     stance = "Neutral"
@@ -919,22 +620,15 @@ Frontier: {frontier_signal}
 
 Define today's stance: Defensive / Neutral / Accumulative / Opportunistic / Aggressive
 
-Return JSON:
-{{
-  "stance": "Stance",
-  "mindset": "One-line mindset for the user",
-  "analysis": "2-3 sentence synthesis of all signals"
-}}"""
+""" + STRATEGY_RESPONSE_SCHEMA
     
     system_prompt = "You are The Strategy - Unified Opportunity Radar. Synthesize cross-dashboard insights."
     
     result = call_ai(prompt, system_prompt, ['chimera', 'kimi'])
     if result:
         try:
-            start = result.find('{')
-            end = result.rfind('}') + 1
-            if start != -1 and end > start:
-                parsed = json.loads(result[start:end])
+            parsed = extract_json(result)
+            if parsed:
                 stance = parsed.get('stance', stance)
                 mindset = parsed.get('mindset', mindset)
                 analysis = parsed.get('analysis', analysis)
@@ -972,18 +666,18 @@ Return JSON:
         ]
     }
 
-def analyze_the_library() -> Dict:
-    """THE LIBRARY - Alpha-Clarity Archive"""
-    logger.info("=" * 50)
-    logger.info("📚 ANALYZING: THE LIBRARY")
-    logger.info("=" * 50)
-    
+LIBRARY_RESPONSE_SCHEMA = """Return JSON:
+{
+  "summaries": [
+    {"title": "Title", "eli5": "Simple explanation", "long_term": "Why it matters long-term"}
+  ],
+  "analysis": "2-3 sentence overview of today's knowledge stream and key learning themes."
+}"""
+
+def library_ai_request() -> Optional[Dict]:
+    """Build The Library's call_ai request (None when there is no news to summarize)"""
     news_articles = store.get('news.articles') or []
     
-    # AI Analysis
-    summaries = []
-    analysis = "Analysis temporarily unavailable"
-    
     if news_articles:
         articles_text = "\n".join([f"{i+1}. {a['title']}" for i, a in enumerate(news_articles[:10])])
         
@@ -995,27 +689,32 @@ HEADLINES:
 For each, provide an ELI5 summary and why it matters long-term.
 Also provide a brief general analysis of the knowledge landscape today.
 
-Return JSON:
-{{
-  "summaries": [
-    {{"title": "Title", "eli5": "Simple explanation", "long_term": "Why it matters long-term"}}
-  ],
-  "analysis": "2-3 sentence overview of today's knowledge stream and key learning themes."
-}}"""
+""" + LIBRARY_RESPONSE_SCHEMA
         
         system_prompt = "You are The Library - Alpha-Clarity Archive. Simplify complex market knowledge."
         
-        result = call_ai(prompt, system_prompt, ['longcat', 'gemma-2b'], max_tokens=2000)
-        if result:
-            try:
-                start = result.find('{')
-                end = result.rfind('}') + 1
-                if start != -1 and end > start:
-                    parsed = json.loads(result[start:end])
-                    summaries = parsed.get('summaries', summaries)
-                    analysis = parsed.get('analysis', analysis)
-            except:
-                pass
+        return {'prompt': prompt, 'system_prompt': system_prompt, 'models': ['longcat', 'gemma-2b'], 'max_tokens': 2000}
+    
+    return None
+
+def analyze_the_library(ai_response: Optional[str] = None) -> Dict:
+    """THE LIBRARY - Alpha-Clarity Archive"""
+    logger.debug("=" * 50)
+    logger.info("📚 ANALYZING: THE LIBRARY")
+    logger.debug("=" * 50)
+    
+    # AI Analysis
+    summaries = []
+    analysis = "Analysis temporarily unavailable"
+    
+    if ai_response:
+        try:
+            parsed = extract_json(ai_response)
+            if parsed:
+                summaries = parsed.get('summaries', summaries)
+                analysis = parsed.get('analysis', analysis)
+        except:
+            pass
     
     # Calculate scoring metrics
     progress_rate = 65 # Placeholder
@@ -1040,81 +739,59 @@ Return JSON:
         ]
     }
 
+COMMANDER_RESPONSE_SCHEMA = """Return JSON:
+{
+  "weather_of_the_day": "One word: Stormy / Cloudy / Sunny / Volatile / Foggy",
+  "top_signal": "The single most important data point today",
+  "why_it_matters": "Detailed explanation (3-4 sentences) of why this signal is critical right now.",
+  "cross_dashboard_convergence": "A deep paragraph (5-6 sentences) connecting Risk, Crypto, Macro, and Tech. How do these forces interact today? Where is the friction? Where is the flow?",
+  "action_stance": "Sit tight / Accumulate / Cautious / Aggressive / Review markets",
+  "optional_deep_insight": "Two paragraphs of advanced market theory applied to today's data. Connect the dots for a professional trader.",
+  "clarity_level": "High / Medium / Low based on data convergence",
+  "summary_sentence": "A final, powerful closing thought that synthesizes the entire briefing."
+}"""
+
 def analyze_the_commander() -> Dict:
     """THE COMMANDER - Morning Brief Generator"""
-    logger.info("=" * 50)
+    logger.debug("=" * 50)
     logger.info("⭐ GENERATING: THE COMMANDER (Morning Brief)")
-    logger.info("=" * 50)
+    logger.debug("=" * 50)
     
     # Load all dashboard data
-    shield_data = {}
-    coin_data = {}
-    map_data = {}
-    frontier_data = {}
-    strategy_data = {}
-    library_data = {}
-    
-    try:
-        shield_file = DATA_DIR / 'the-shield' / 'latest.json'
-        if shield_file.exists():
-            shield_data = json.loads(shield_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        coin_file = DATA_DIR / 'the-coin' / 'latest.json'
-        if coin_file.exists():
-            coin_data = json.loads(coin_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        map_file = DATA_DIR / 'the-map' / 'latest.json'
-        if map_file.exists():
-            map_data = json.loads(map_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        frontier_file = DATA_DIR / 'the-frontier' / 'latest.json'
-        if frontier_file.exists():
-            frontier_data = json.loads(frontier_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        strategy_file = DATA_DIR / 'the-strategy' / 'latest.json'
-        if strategy_file.exists():
-            strategy_data = json.loads(strategy_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        library_file = DATA_DIR / 'the-library' / 'latest.json'
-        if library_file.exists():
-            library_data = json.loads(library_file.read_text(encoding='utf-8'))
-    except:
-        pass
+    dashboards = load_dashboards('the-shield', 'the-coin', 'the-map', 'the-frontier', 'the-strategy', 'the-library')
+    shield_data = dashboards['the-shield']
+    coin_data = dashboards['the-coin']
+    map_data = dashboards['the-map']
+    frontier_data = dashboards['the-frontier']
+    strategy_data = dashboards['the-strategy']
+    library_data = dashboards['the-library']
     
     # AI Generation of Morning Brief
     morning_brief = {}
     
+    # Every fetch and dashboard came back empty - there's nothing for the brief to synthesize
+    macro = map_data.get('macro', {})
+    has_inputs = (
+        any(value is not None for value in (coin_data.get('btc_price'), macro.get('oil'), macro.get('sp500')))
+        or shield_data.get('metrics') or frontier_data.get('breakthroughs') or library_data.get('summaries')
+    )
+    
     prompt = f"""Create a 4-Minute Deep Dive Morning Brief.
     
 DATA FROM ALL DASHBOARDS:
 
 THE SHIELD (Risk):
-{json.dumps(shield_data.get('risk_assessment', {}), indent=2)}
+{json_dumps(shield_data.get('risk_assessment', {})).decode('utf-8')}
 Top metric signals: {', '.join([m['name'] + ': ' + m['signal'] for m in shield_data.get('metrics', [])[:3]])}
 
 THE COIN (Crypto):
 Momentum: {coin_data.get('momentum', 'N/A')}
-BTC: ${coin_data.get('btc_price', 0):,.0f}
+BTC: ${coin_data.get('btc_price') or 0:,.0f}
 
 THE MAP (Macro):
 TASI Mood: {map_data.get('tasi_mood', 'N/A')}
-Oil: ${map_data.get('macro', {}).get('oil', 0):.2f}
-SP500: {map_data.get('macro', {}).get('sp500', 0):.2f}
+Oil: ${map_data.get('macro', {}).get('oil') or 0:.2f}
+SP500: {map_data.get('macro', {}).get('sp500') or 0:.2f}
 
 THE FRONTIER (Breakthroughs):
 {len(frontier_data.get('breakthroughs', []))} breakthroughs identified
@@ -1129,27 +806,18 @@ INSTRUCTIONS:
 Create a comprehensive, structured Morning Brief (approx. 4 minutes read time).
 Go BEYOND surface-level summaries. Synthesize the data into a coherent narrative.
 
-Return JSON:
-{{
-  "weather_of_the_day": "One word: Stormy / Cloudy / Sunny / Volatile / Foggy",
-  "top_signal": "The single most important data point today",
-  "why_it_matters": "Detailed explanation (3-4 sentences) of why this signal is critical right now.",
-  "cross_dashboard_convergence": "A deep paragraph (5-6 sentences) connecting Risk, Crypto, Macro, and Tech. How do these forces interact today? Where is the friction? Where is the flow?",
-  "action_stance": "Sit tight / Accumulate / Cautious / Aggressive / Review markets",
-  "optional_deep_insight": "Two paragraphs of advanced market theory applied to today's data. Connect the dots for a professional trader.",
-  "clarity_level": "High / Medium / Low based on data convergence",
-  "summary_sentence": "A final, powerful closing thought that synthesizes the entire briefing."
-}}"""
+""" + COMMANDER_RESPONSE_SCHEMA
     
     system_prompt = "You are The Commander - Master Orchestrator. Generate the ultimate daily Morning Brief. Be deep, insightful, and professional."
     
-    result = call_ai(prompt, system_prompt, ['llama-70b', 'olmo-32b'], max_tokens=3000)
+    result = None
+    if has_inputs:
+        result = call_ai(prompt, system_prompt, ['llama-70b', 'olmo-32b'], max_tokens=3000)
+    else:
+        logger.warning("  ⚠️ No dashboard data available. Skipping Commander AI call.")
     if result:
         try:
-            start = result.find('{')
-            end = result.rfind('}') + 1
-            if start != -1 and end > start:
-                morning_brief = json.loads(result[start:end])
+            morning_brief = extract_json(result)
         except:
             pass
     
@@ -1183,7 +851,7 @@ Return JSON:
         'name': 'The Commander',
         'role': 'Master Orchestrator',
         'mission': 'Combine all dashboards using waterfall loading logic to produce the final unified assessment.',
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': RUN_STARTED_AT.isoformat(),
         'morning_brief': morning_brief,
         'internal_summary_sentence': "Risk shows the environment, crypto shows sentiment, macro shows the wind, breakthroughs show the future, strategy shows the stance, and knowledge shows the long-term signal — combine all six to guide the user clearly through today.",
         'apps_status': {
@@ -1205,11 +873,14 @@ def main():
     parser.add_argument('--all', action='store_true', help='Run for all dashboards (default)')
     parser.add_argument('--app', type=str, help='Run for specific dashboard (e.g., the-shield)')
     parser.add_argument('--no-ai', action='store_true', help='Disable AI generation to save quota')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached fetch/AI results and refresh everything')
     args = parser.parse_args()
 
     # Set env var for no-ai so it's accessible globally if needed, or just rely on logic
     if args.no_ai:
         os.environ['DISABLE_AI'] = 'true'
+    if args.no_cache:
+        os.environ['DISABLE_CACHE'] = 'true'
 
     # Default to all if no specific app is requested
     run_all = args.all or not args.app
@@ -1217,7 +888,7 @@ def main():
 
     logger.info("=" * 60)
     logger.info("🚀 DAILY ALPHA LOOP - UNIFIED FETCHER V2")
-    logger.info(f"📅 {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    logger.info(f"📅 {RUN_TIMESTAMP}")
     logger.info("=" * 60)
     
     # STEP 1: Fetch ALL data ONCE (centralized)
@@ -1227,23 +898,7 @@ def main():
     logger.info("STEP 1: CENTRALIZED DATA FETCHING")
     logger.info("=" * 60)
     
-    fetch_market_data()
-    time.sleep(1)  # Rate limiting
-    
-    fetch_crypto_indicators()
-    time.sleep(1)
-    
-    fetch_treasury_data()
-    time.sleep(1)
-    
-    fetch_fear_and_greed()
-    time.sleep(1)
-    
-    fetch_news()
-    time.sleep(1)
-    
-    fetch_arxiv_papers()
-    time.sleep(1)
+    fetch_all()
     
     # STEP 2: Generate dashboard analyses (waterfall pattern)
     logger.info("\n" + "=" * 60)
@@ -1255,46 +910,40 @@ def main():
     # Helper to save dashboard data
     def save_dashboard(data, folder_name):
         dashboards.append(data)
-        (DATA_DIR / folder_name).mkdir(parents=True, exist_ok=True)
-        (DATA_DIR / folder_name / 'latest.json').write_text(json.dumps(data, indent=2), encoding='utf-8')
-        logger.info(f"✅ Saved {folder_name}")
-
-    # Load Risk (1) and Macro (3)
-    if run_all or target_app == 'the-shield':
-        logger.info("\n📊 Wave 1: Risk (The Shield)")
-        save_dashboard(analyze_the_shield(), 'the-shield')
-
-    if run_all or target_app == 'the-map':
-        logger.info("\n📊 Wave 1: Macro (The Map)")
-        save_dashboard(analyze_the_map(), 'the-map')
-    
-    if run_all: time.sleep(2)  # Wait between waves
-    
-    # Load Crypto (2) and AI Race (4)
-    if run_all or target_app == 'the-coin':
-        logger.info("\n📊 Wave 2: Crypto (The Coin)")
-        save_dashboard(analyze_the_coin(), 'the-coin')
-
-    if run_all or target_app == 'the-frontier':
-        logger.info("\n📊 Wave 2: Frontier (The Frontier)")
-        save_dashboard(analyze_the_frontier(), 'the-frontier')
-    
-    if run_all: time.sleep(2)
-    
-    # Load Free Knowledge (6)
-    if run_all or target_app == 'the-library':
-        logger.info("\n📊 Wave 3: Library (The Library)")
-        save_dashboard(analyze_the_library(), 'the-library')
+        # Kept in memory too, so Strategy/Commander don't re-read what was just written
+        store.set(f'dashboard.{folder_name}', data)
+        if write_dashboard(folder_name, data):
+            logger.info(f"✅ Saved {folder_name}")
+        else:
+            logger.info(f"✅ {folder_name} unchanged since last run, kept existing file and its last_update")
+
+    # The Shield's prompt and dashboard share one metrics classification
+    shield = shield_metrics(SHIELD_METRICS_V2)
+    
+    # Risk (1), Macro (3), Crypto (2), Frontier (4) and Free Knowledge (6) don't
+    # depend on each other, so their AI calls are fired concurrently
+    independent_dashboards = {
+        'the-shield': (lambda: shield_ai_request(shield), lambda ai_response: analyze_the_shield(ai_response, shield)),
+        'the-map': (map_ai_request, analyze_the_map),
+        'the-coin': (coin_ai_request, analyze_the_coin),
+        'the-frontier': (frontier_ai_request, analyze_the_frontier),
+        'the-library': (library_ai_request, analyze_the_library),
+    }
+    selected = [app for app in independent_dashboards if run_all or target_app == app]
     
-    if run_all: time.sleep(2)
+    if selected:
+        logger.info(f"\n📊 Waves 1-3: {', '.join(selected)} (concurrent AI calls)")
+        ai_responses = call_ai_many([independent_dashboards[app][0]() for app in selected])
+        for app, ai_response in zip(selected, ai_responses):
+            save_dashboard(independent_dashboards[app][1](ai_response), app)
     
+    # Strategy and Commander read the dashboards saved above, so they stay
+    # sequential - but there's no need to idle between waves
     # Generate Strategy (5)
     if run_all or target_app == 'the-strategy':
         logger.info("\n📊 Wave 4: Strategy (The Strategy)")
         save_dashboard(analyze_the_strategy(), 'the-strategy')
     
-    if run_all: time.sleep(2)
-    
     # Finally, generate Master Orchestrator (7)
     # The Commander usually needs all previous data, but we'll allow running it alone if requested
     if run_all or target_app == 'the-commander':
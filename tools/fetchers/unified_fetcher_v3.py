@@ -18,12 +18,9 @@ import sys
 import json
 import logging
 import argparse
-import pathlib
-import time
-from datetime import datetime, timezone, timedelta
-from typing import Dict, List, Optional, Any
+import hashlib
+from typing import Dict, Optional
 from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # ========================================
 # Configuration & Setup
@@ -37,11 +34,14 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Paths
-ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
-DATA_DIR = ROOT_DIR / 'data'
-CACHE_DIR = DATA_DIR / 'cache'
-CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Shared fetching infrastructure (data store, caches, fetchers, dashboard files)
+from common import (
+    ROOT_DIR, RUN_STARTED_AT, RUN_TIMESTAMP, REQUESTS_AVAILABLE, CONNECT_TIMEOUT, http_session,
+    json_loads, json_dumps, extract_json, bullet_list, store,
+    AI_QUOTA_COOLDOWN, mark_ai_quota_exceeded, ai_quota_exceeded, single_flight, TokenBucket,
+    fetch_cache, cache_reads_enabled, fetch_all, write_dashboard, load_dashboards,
+    shield_metrics, stale_prices, stale_price_note,
+)
 
 # Load .env file
 try:
@@ -80,32 +80,6 @@ for key_name, key_value in API_KEYS.items():
     status = "✅ Set" if key_value else "❌ Missing"
     logger.info(f"  {key_name}: {status}")
 
-# Third-party imports
-try:
-    import requests
-    REQUESTS_AVAILABLE = True
-except ImportError:
-    REQUESTS_AVAILABLE = False
-    logging.warning("requests not available")
-
-try:
-    import yfinance as yf
-    YFINANCE_AVAILABLE = True
-except ImportError:
-    YFINANCE_AVAILABLE = False
-
-try:
-    import feedparser
-    FEEDPARSER_AVAILABLE = True
-except ImportError:
-    FEEDPARSER_AVAILABLE = False
-
-try:
-    import pandas as pd
-    import numpy as np
-    PANDAS_AVAILABLE = True
-except ImportError:
-    PANDAS_AVAILABLE = False
 
 # ========================================
 # OpenRouter Free Models Configuration
@@ -136,309 +110,84 @@ FREE_OPENROUTER_MODELS = [
 ]
 
 # ========================================
-# Centralized Data Store
-# ========================================
-
-class DataStore:
-    """
-    Centralized in-memory store for all fetched data.
-    Prevents duplicate API calls across dashboards.
-    """
-    def __init__(self):
-        self.data = {}
-        self.fetched_at = {}
-    
-    def set(self, key: str, value: Any):
-        self.data[key] = value
-        self.fetched_at[key] = datetime.now(timezone.utc).isoformat()
-        logger.info(f"📦 Stored: {key}")
-    
-    def get(self, key: str) -> Any:
-        return self.data.get(key)
-    
-    def has(self, key: str) -> bool:
-        return key in self.data
-    
-    def to_dict(self) -> Dict:
-        return {
-            'data': self.data,
-            'fetched_at': self.fetched_at,
-            'timestamp': datetime.now(timezone.utc).isoformat()
-        }
-
-# Global data store instance
-store = DataStore()
-
-# Global flag to track quota status
-AI_QUOTA_EXCEEDED = False
-
-# ========================================
-# Fetch Functions (Call ONCE)
+# Unified AI Analysis Function
 # ========================================
 
-def fetch_market_data():
-    """Fetch ALL market data once - used by multiple dashboards"""
-    logger.info("=" * 50)
-    logger.info("📈 FETCHING MARKET DATA (ONCE for all dashboards)")
-    logger.info("=" * 50)
-    
-    if not YFINANCE_AVAILABLE:
-        logger.error("yfinance not available")
-        return
-    
-    # Define all tickers needed by ANY dashboard
-    tickers = {
-        # Risk Dashboard (The Shield)
-        'JPY': 'JPY=X',
-        'CNH': 'CNH=X',
-        'TNX': '^TNX',  # 10Y Treasury
-        'MOVE': '^MOVE',
-        'VIX': '^VIX',
-        'CBON': 'CBON',
-        
-        # Crypto (The Coin)
-        'BTC': 'BTC-USD',
-        'ETH': 'ETH-USD',
-        
-        # Macro (The Map)
-        'DXY': 'DX-Y.NYB',
-        'GOLD': 'GC=F',
-        'OIL': 'CL=F',
-        'SP500': '^GSPC',
-        'TASI': '^TASI.SR',
-    }
-    
-    # Fetch in parallel
-    def fetch_ticker(name, ticker):
-        try:
-            logger.info(f"  Fetching {name} ({ticker})...")
-            t = yf.Ticker(ticker)
-            price = None
-            
-            try:
-                price = t.fast_info.last_price
-            except:
-                pass
-            
-            if price is None:
-                hist = t.history(period='1d')
-                if not hist.empty:
-                    price = float(hist['Close'].iloc[-1])
-            
-            return name, price
-        except Exception as e:
-            logger.warning(f"  Failed {name}: {e}")
-            return name, None
-    
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        futures = [executor.submit(fetch_ticker, name, ticker) for name, ticker in tickers.items()]
-        for future in as_completed(futures):
-            name, price = future.result()
-            if price is not None:
-                store.set(f'market.{name}', price)
+# OpenRouter free models allow 20 requests per minute per account
+openrouter_rate_limit = TokenBucket(rate=20 / 60, burst=20)
 
-def fetch_crypto_indicators():
-    """Fetch crypto with technical indicators (for The Coin)"""
-    logger.info("=" * 50)
-    logger.info("📊 FETCHING CRYPTO INDICATORS")
-    logger.info("=" * 50)
-    
-    if not YFINANCE_AVAILABLE or not PANDAS_AVAILABLE:
-        return
-    
-    for symbol in ['BTC-USD', 'ETH-USD']:
-        try:
-            logger.info(f"  Fetching {symbol} indicators...")
-            df = yf.download(symbol, period='5y', interval='1wk', progress=False)
-            
-            if df.empty:
-                continue
-            
-            # Flatten MultiIndex
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-            
-            # Calculate indicators
-            df['SMA_20'] = df['Close'].rolling(window=20).mean()
-            df['EMA_21'] = df['Close'].ewm(span=21, adjust=False).mean()
-            df['MA50'] = df['Close'].rolling(window=50).mean()
-            df['MA200'] = df['Close'].rolling(window=200).mean()
-            
-            # RSI
-            delta = df['Close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            df['RSI'] = 100 - (100 / (1 + rs))
-            
-            latest = df.iloc[-1]
-            ticker_name = symbol.replace('-USD', '')
-            
-            store.set(f'crypto.{ticker_name}.sma_20', float(latest['SMA_20']) if not pd.isna(latest['SMA_20']) else None)
-            store.set(f'crypto.{ticker_name}.ema_21', float(latest['EMA_21']) if not pd.isna(latest['EMA_21']) else None)
-            store.set(f'crypto.{ticker_name}.ma50', float(latest['MA50']) if not pd.isna(latest['MA50']) else None)
-            store.set(f'crypto.{ticker_name}.ma200', float(latest['MA200']) if not pd.isna(latest['MA200']) else None)
-            store.set(f'crypto.{ticker_name}.rsi', float(latest['RSI']) if not pd.isna(latest['RSI']) else None)
-            store.set(f'crypto.{ticker_name}.trend', 'Bullish' if latest['Close'] > latest['SMA_20'] else 'Bearish')
-            
-        except Exception as e:
-            logger.warning(f"  Failed {symbol} indicators: {e}")
+# Static instructions and output schema go first and the per-run data last, so
+# providers with automatic prefix caching can reuse the header across runs.
+# Keep this a plain string - nothing run-specific may be interpolated into it
+UNIFIED_PROMPT_HEADER = """You are the Master AI Analyst for the Daily Alpha Loop system. 
+Analyze the market data at the end of this prompt and generate comprehensive 4-minute briefings for ALL 7 dashboards.
 
-def fetch_treasury_data():
-    """Fetch Treasury auction data"""
-    logger.info("=" * 50)
-    logger.info("🏛️ FETCHING TREASURY DATA")
-    logger.info("=" * 50)
-    
-    if not REQUESTS_AVAILABLE:
-        return
-    
-    try:
-        url = "https://api.fiscaldata.treasury.gov/services/api/fiscal_service/v1/accounting/od/auctions_query"
-        params = {
-            'filter': 'security_term:eq:10-Year,security_type:eq:Note',
-            'sort': '-auction_date',
-            'page[size]': 1
-        }
-        
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if 'data' in data and len(data['data']) > 0:
-            result = data['data'][0]
-            store.set('treasury.10y_bid_to_cover', float(result.get('bid_to_cover_ratio', 0)))
-            store.set('treasury.10y_auction_date', result.get('auction_date'))
-            
-    except Exception as e:
-        logger.warning(f"  Failed treasury data: {e}")
-
-def fetch_fear_and_greed():
-    """Fetch crypto Fear & Greed Index"""
-    logger.info("=" * 50)
-    logger.info("😱 FETCHING FEAR & GREED INDEX")
-    logger.info("=" * 50)
-    
-    if not REQUESTS_AVAILABLE:
-        return
-    
-    try:
-        response = requests.get('https://api.alternative.me/fng/?limit=1', timeout=10)
-        data = response.json()
-        
-        store.set('fng.value', int(data['data'][0]['value']))
-        store.set('fng.classification', data['data'][0]['value_classification'])
-        store.set('fng.timestamp', data['data'][0]['timestamp'])
-        
-    except Exception as e:
-        logger.warning(f"  Failed F&G: {e}")
-
-def fetch_news():
-    """Fetch news from RSS feeds"""
-    logger.info("=" * 50)
-    logger.info("📰 FETCHING NEWS")
-    logger.info("=" * 50)
-    
-    feeds = [
-        'https://finance.yahoo.com/news/rssindex',
-        'https://cointelegraph.com/rss',
-        'https://www.marketwatch.com/rss/topstories',
-        'https://www.artificialintelligence-news.com/feed/',
-    ]
-    
-    articles = []
-    
-    if FEEDPARSER_AVAILABLE:
-        for feed_url in feeds:
-            try:
-                logger.info(f"  Fetching {feed_url}...")
-                feed = feedparser.parse(feed_url)
-                for entry in feed.entries[:5]:
-                    articles.append({
-                        'title': entry.get('title', 'No title'),
-                        'source': feed.feed.get('title', 'Unknown'),
-                        'url': entry.get('link'),
-                        'publishedAt': entry.get('published')
-                    })
-            except Exception as e:
-                logger.debug(f"  Feed error: {e}")
-    
-    store.set('news.articles', articles[:20])
-
-def fetch_arxiv_papers():
-    """Fetch arXiv research papers"""
-    logger.info("=" * 50)
-    logger.info("📚 FETCHING ARXIV PAPERS")
-    logger.info("=" * 50)
-    
-    import ssl
-    import urllib.request
-    import urllib.parse
-    import xml.etree.ElementTree as ET
-    
-    domains = {
-        "AI Research": "cat:cs.AI OR cat:cs.LG",
-        "Advanced Manufacturing": "cat:cs.RO OR cat:cs.SY",
-        "Biotechnology": "cat:q-bio.BM OR cat:q-bio.GN",
-        "Quantum Computing": "cat:quant-ph",
-        "Semiconductors": "cat:cond-mat.mes-hall OR cat:cs.ET"
-    }
-    
-    for domain_name, query in domains.items():
-        try:
-            logger.info(f"  Fetching {domain_name}...")
-            params = {
-                'search_query': query,
-                'start': 0,
-                'max_results': 5,
-                'sortBy': 'submittedDate',
-                'sortOrder': 'descending'
-            }
-            url = f"http://export.arxiv.org/api/query?{urllib.parse.urlencode(params)}"
-            
-            context = ssl._create_unverified_context()
-            response = urllib.request.urlopen(url, context=context, timeout=30)
-            xml_data = response.read().decode('utf-8')
-            
-            root = ET.fromstring(xml_data)
-            ns = {'atom': 'http://www.w3.org/2005/Atom', 'opensearch': 'http://a9.com/-/spec/opensearch/1.1/'}
-            
-            total = root.find('opensearch:totalResults', ns)
-            total_results = int(total.text) if total is not None else 0
-            
-            papers = []
-            for entry in root.findall('atom:entry', ns):
-                title = entry.find('atom:title', ns)
-                summary = entry.find('atom:summary', ns)
-                published = entry.find('atom:published', ns)
-                link = entry.find('atom:id', ns)
-                
-                papers.append({
-                    'title': title.text.strip().replace('\n', ' ') if title is not None else 'Unknown',
-                    'summary': (summary.text.strip()[:200] + '...') if summary is not None and summary.text else '',
-                    'date': published.text[:10] if published is not None else '',
-                    'link': link.text if link is not None else ''
-                })
-            
-            store.set(f'arxiv.{domain_name}.total', total_results)
-            store.set(f'arxiv.{domain_name}.papers', papers)
-            
-        except Exception as e:
-            logger.warning(f"  Failed {domain_name}: {e}")
+TASK:
+Generate a comprehensive JSON response with deep analysis for ALL 7 dashboards.
+Each analysis should be suitable for a 4-minute read - go beyond surface level.
+Be specific, insightful, and actionable.
 
-# ========================================
-# Unified AI Analysis Function
-# ========================================
+Return ONLY valid JSON in this exact structure:
+{
+  "the_shield": {
+    "analysis": "3-4 sentence deep analysis of systemic market fragility, stress points, and what professional traders should watch. Be specific about which metrics signal danger.",
+    "risk_level": "CRITICAL/ELEVATED/LOW",
+    "top_concern": "The single biggest risk factor right now"
+  },
+  "the_coin": {
+    "analysis": "3-4 sentence analysis of crypto momentum, rotation dynamics, and institutional flow. Address both BTC and ETH specifically.",
+    "momentum": "Bullish/Bearish/Neutral",
+    "key_level": "The most important price level to watch"
+  },
+  "the_map": {
+    "analysis": "4-5 sentence macro analysis focusing on how oil prices, dollar strength, and global rates impact TASI and Saudi markets. Connect the dots between global macro and regional impact.",
+    "tasi_mood": "Positive/Neutral/Negative",
+    "drivers": ["Driver 1", "Driver 2", "Driver 3"],
+    "tasi_forecast": "What's the likely directional bias for TASI this week?"
+  },
+  "the_frontier": {
+    "analysis": "3-4 sentence analysis of AI and tech breakthrough velocity. What's accelerating? What's real vs hype?",
+    "breakthroughs": [
+      {"title": "Breakthrough 1", "why_it_matters": "Impact explanation"},
+      {"title": "Breakthrough 2", "why_it_matters": "Impact explanation"}
+    ],
+    "velocity": "Slow/Moderate/Fast/Exponential"
+  },
+  "the_strategy": {
+    "analysis": "4-5 sentence synthesis of all signals above. How do risk, crypto, macro, and tech align or conflict? What's the unified market narrative today?",
+    "stance": "Defensive/Neutral/Accumulative/Opportunistic/Aggressive",
+    "mindset": "One powerful sentence capturing the strategic approach for today",
+    "conviction": "High/Medium/Low"
+  },
+  "the_library": {
+    "analysis": "2-3 sentence overview of today's knowledge landscape and key learning themes from news and research",
+    "summaries": [
+      {"title": "Complex Topic 1", "eli5": "Simple explanation", "long_term": "Why it matters"},
+      {"title": "Complex Topic 2", "eli5": "Simple explanation", "long_term": "Why it matters"}
+    ],
+    "knowledge_velocity": "How fast is breakthrough knowledge accumulating?"
+  },
+  "the_commander": {
+    "weather_of_the_day": "Stormy/Cloudy/Sunny/Volatile/Foggy",
+    "top_signal": "The single most important data point across all dashboards today",
+    "why_it_matters": "4-5 sentence deep explanation of why this signal is critical right now. What are the second and third order effects?",
+    "cross_dashboard_convergence": "5-6 sentence paragraph connecting Risk, Crypto, Macro, and Tech. How do these forces interact today? Where is the friction? Where is alignment? What does this mean for positioning?",
+    "action_stance": "Specific actionable guidance",
+    "optional_deep_insight": "Two paragraphs of advanced market theory applied to today's data. Connect uncommon dots for professional traders. Go deep.",
+    "clarity_level": "High/Medium/Low",
+    "summary_sentence": "One powerful closing thought that synthesizes everything"
+  }
+}
+"""
 
+@single_flight
 def call_unified_ai(all_data: Dict) -> Optional[Dict]:
     """
     Make ONE comprehensive AI call for ALL dashboards.
     Uses OpenRouter with fallback through 21 free models.
     Returns structured JSON with analysis for all 7 dashboards.
     """
-    global AI_QUOTA_EXCEEDED
-    
-    if AI_QUOTA_EXCEEDED:
+    if ai_quota_exceeded():
         logger.warning("  ⚠️ AI Quota previously exceeded. Skipping AI call.")
         return None
 
@@ -450,18 +199,21 @@ def call_unified_ai(all_data: Dict) -> Optional[Dict]:
         logger.warning("AI not available (no requests library)")
         return None
     
+    # Every fetch came back empty - there's nothing for the model to analyze
+    if not any(all_data.values()):
+        logger.warning("  ⚠️ No market data available. Skipping AI call.")
+        return None
+    
     openrouter_key = API_KEYS.get('OPENROUTER')
     if not openrouter_key:
         logger.error("❌ OPENROUTER_KEY not found. AI generation disabled.")
         return None
 
     # Build comprehensive prompt for all dashboards
-    prompt = f"""You are the Master AI Analyst for the Daily Alpha Loop system. 
-Analyze the following market data and generate comprehensive 4-minute briefings for ALL 7 dashboards.
-
+    prompt = UNIFIED_PROMPT_HEADER + f"""
 CURRENT MARKET DATA:
 ====================
-
+{stale_price_note(all_data.get('price_stale'))}
 RISK DATA (The Shield):
 - JPY: {all_data.get('jpy', 'N/A')}
 - CNH: {all_data.get('cnh', 'N/A')}
@@ -471,8 +223,8 @@ RISK DATA (The Shield):
 - 10Y Bid-to-Cover: {all_data.get('btc_10y', 'N/A')}
 
 CRYPTO DATA (The Coin):
-- BTC Price: ${all_data.get('btc_price', 0):,.0f}
-- ETH Price: ${all_data.get('eth_price', 0):,.0f}
+- BTC Price: ${all_data.get('btc_price') or 0:,.0f}
+- ETH Price: ${all_data.get('eth_price') or 0:,.0f}
 - BTC RSI: {all_data.get('btc_rsi', 'N/A')}
 - BTC Trend: {all_data.get('btc_trend', 'N/A')}
 - Fear & Greed: {all_data.get('fng_value', 'N/A')} ({all_data.get('fng_class', 'N/A')})
@@ -490,68 +242,18 @@ AI/TECH RESEARCH (The Frontier):
 NEWS HEADLINES (Last 10):
 {all_data.get('news_headlines', 'Market news unavailable')}
 
-TASK:
-Generate a comprehensive JSON response with deep analysis for ALL 7 dashboards.
-Each analysis should be suitable for a 4-minute read - go beyond surface level.
-Be specific, insightful, and actionable.
-
-Return ONLY valid JSON in this exact structure:
-{{
-  "the_shield": {{
-    "analysis": "3-4 sentence deep analysis of systemic market fragility, stress points, and what professional traders should watch. Be specific about which metrics signal danger.",
-    "risk_level": "CRITICAL/ELEVATED/LOW",
-    "top_concern": "The single biggest risk factor right now"
-  }},
-  "the_coin": {{
-    "analysis": "3-4 sentence analysis of crypto momentum, rotation dynamics, and institutional flow. Address both BTC and ETH specifically.",
-    "momentum": "Bullish/Bearish/Neutral",
-    "key_level": "The most important price level to watch"
-  }},
-  "the_map": {{
-    "analysis": "4-5 sentence macro analysis focusing on how oil prices, dollar strength, and global rates impact TASI and Saudi markets. Connect the dots between global macro and regional impact.",
-    "tasi_mood": "Positive/Neutral/Negative",
-    "drivers": ["Driver 1", "Driver 2", "Driver 3"],
-    "tasi_forecast": "What's the likely directional bias for TASI this week?"
-  }},
-  "the_frontier": {{
-    "analysis": "3-4 sentence analysis of AI and tech breakthrough velocity. What's accelerating? What's real vs hype?",
-    "breakthroughs": [
-      {{"title": "Breakthrough 1", "why_it_matters": "Impact explanation"}},
-      {{"title": "Breakthrough 2", "why_it_matters": "Impact explanation"}}
-    ],
-    "velocity": "Slow/Moderate/Fast/Exponential"
-  }},
-  "the_strategy": {{
-    "analysis": "4-5 sentence synthesis of all signals above. How do risk, crypto, macro, and tech align or conflict? What's the unified market narrative today?",
-    "stance": "Defensive/Neutral/Accumulative/Opportunistic/Aggressive",
-    "mindset": "One powerful sentence capturing the strategic approach for today",
-    "conviction": "High/Medium/Low"
-  }},
-  "the_library": {{
-    "analysis": "2-3 sentence overview of today's knowledge landscape and key learning themes from news and research",
-    "summaries": [
-      {{"title": "Complex Topic 1", "eli5": "Simple explanation", "long_term": "Why it matters"}},
-      {{"title": "Complex Topic 2", "eli5": "Simple explanation", "long_term": "Why it matters"}}
-    ],
-    "knowledge_velocity": "How fast is breakthrough knowledge accumulating?"
-  }},
-  "the_commander": {{
-    "weather_of_the_day": "Stormy/Cloudy/Sunny/Volatile/Foggy",
-    "top_signal": "The single most important data point across all dashboards today",
-    "why_it_matters": "4-5 sentence deep explanation of why this signal is critical right now. What are the second and third order effects?",
-    "cross_dashboard_convergence": "5-6 sentence paragraph connecting Risk, Crypto, Macro, and Tech. How do these forces interact today? Where is the friction? Where is alignment? What does this mean for positioning?",
-    "action_stance": "Specific actionable guidance",
-    "optional_deep_insight": "Two paragraphs of advanced market theory applied to today's data. Connect uncommon dots for professional traders. Go deep.",
-    "clarity_level": "High/Medium/Low",
-    "summary_sentence": "One powerful closing thought that synthesizes everything"
-  }}
-}}
-
 CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no code blocks."""
 
+    # Unchanged data produces an identical prompt - reuse the last answer instead of re-asking
+    cache_key = 'ai.unified.' + hashlib.blake2b(prompt.encode('utf-8'), digest_size=16).hexdigest()
+    cached = fetch_cache.get(cache_key) if cache_reads_enabled() else None
+    if cached is not None:
+        logger.info("  💾 Cache hit: unified AI result (inputs unchanged)")
+        return cached
+
     # Try each free model until one succeeds
     for model_index, model in enumerate(FREE_OPENROUTER_MODELS):
-        if AI_QUOTA_EXCEEDED:
+        if ai_quota_exceeded():
             break
         
         try:
@@ -580,36 +282,37 @@ CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no code bloc
                 "X-Title": "Daily Alpha Loop"
             }
             
-            response = requests.post(
+            openrouter_rate_limit.acquire()
+            response = http_session.post(
                 "https://openrouter.ai/api/v1/chat/completions",
-                json=payload,
+                data=json_dumps(payload),
                 headers=headers,
-                timeout=120
+                timeout=(CONNECT_TIMEOUT, 120)
             )
             
             if response.status_code == 200:
-                result = response.json()
+                result = json_loads(response.content)
                 if 'choices' in result and len(result['choices']) > 0:
                     content = result['choices'][0]['message']['content']
                     
                     # Extract JSON from response
                     try:
-                        # Try to find JSON in the response
-                        start = content.find('{')
-                        end = content.rfind('}') + 1
-                        if start != -1 and end > start:
-                            json_content = content[start:end]
-                            parsed = json.loads(json_content)
-                            
-                            logger.info(f"  ✅ SUCCESS with {model}!")
-                            return parsed
+                        parsed = extract_json(content)
+                        
+                        logger.info(f"  ✅ SUCCESS with {model}!")
+                        fetch_cache.set(cache_key, parsed, 6 * 3600)
+                        return parsed
                     except json.JSONDecodeError as je:
                         logger.warning(f"  JSON parse error with {model}: {je}")
                         continue
                         
             elif response.status_code == 429:
+                # The daily free-model quota is shared by every model - no point trying the rest
+                if 'free-models-per-day' in response.text:
+                    logger.error(f"  ⛔ OpenRouter daily free-model quota exceeded. Pausing AI calls for {AI_QUOTA_COOLDOWN // 60} minutes.")
+                    mark_ai_quota_exceeded()
+                    break
                 logger.warning(f"  ⚠️ {model} rate limited (429), trying next...")
-                time.sleep(2)
                 continue
             else:
                 logger.warning(f"  {model} failed: {response.status_code}")
@@ -628,75 +331,10 @@ CRITICAL: Return ONLY the JSON object, no markdown, no explanation, no code bloc
 
 def build_shield_data(ai_result: Optional[Dict] = None) -> Dict:
     """Build The Shield dashboard data"""
-    jpy = store.get('market.JPY')
-    cnh = store.get('market.CNH')
-    tnx = store.get('market.TNX')
     move = store.get('market.MOVE')
-    vix = store.get('market.VIX')
-    cbon = store.get('market.CBON')
     btc_10y = store.get('treasury.10y_bid_to_cover')
     
-    # Build metrics
-    metrics = []
-    
-    if btc_10y:
-        signal = "CRITICAL SHOCK" if btc_10y < 2.0 else "HIGH STRESS" if btc_10y < 2.3 else "NORMAL"
-        metrics.append({
-            'name': '10Y Treasury Bid-to-Cover',
-            'value': f'{btc_10y:.2f}x',
-            'signal': signal
-        })
-    
-    if jpy:
-        signal = "CRITICAL SHOCK" if jpy >= 155 else "HIGH STRESS" if jpy >= 150 else "RISING STRESS" if jpy > 145 else "NORMAL"
-        metrics.append({
-            'name': 'USD/JPY',
-            'value': f'{jpy:.2f}',
-            'signal': signal
-        })
-    
-    if cnh:
-        signal = "CRITICAL SHOCK" if cnh >= 7.4 else "HIGH STRESS" if cnh >= 7.25 else "RISING STRESS" if cnh > 7.15 else "NORMAL"
-        metrics.append({
-            'name': 'USD/CNH',
-            'value': f'{cnh:.4f}',
-            'signal': signal
-        })
-    
-    if tnx:
-        signal = "CRITICAL SHOCK" if tnx >= 5.0 else "HIGH STRESS" if tnx >= 4.5 else "RISING STRESS" if tnx >= 4.2 else "NORMAL"
-        metrics.append({
-            'name': '10Y Treasury Yield',
-            'value': f'{tnx:.2f}%',
-            'signal': signal
-        })
-    
-    if move:
-        signal = "CRITICAL SHOCK" if move >= 120 else "HIGH STRESS" if move >= 90 else "RISING STRESS" if move > 80 else "NORMAL"
-        metrics.append({
-            'name': 'MOVE Index',
-            'value': f'{move:.2f}',
-            'signal': signal
-        })
-    
-    if vix:
-        signal = "CRITICAL SHOCK" if vix >= 40 else "HIGH STRESS" if vix >= 30 else "RISING STRESS" if vix > 20 else "NORMAL"
-        metrics.append({
-            'name': 'VIX',
-            'value': f'{vix:.2f}',
-            'signal': signal
-        })
-    
-    # Calculate composite risk
-    weights = {"CRITICAL SHOCK": 100, "HIGH STRESS": 75, "RISING STRESS": 40, "NORMAL": 0}
-    score = sum(weights.get(m['signal'], 0) for m in metrics) / len(metrics) if metrics else 0
-    
-    if score >= 60:
-        risk = {"score": round(score, 1), "level": "CRITICAL", "color": "#dc3545"}
-    elif score >= 35:
-        risk = {"score": round(score, 1), "level": "ELEVATED", "color": "#ffc107"}
-    else:
-        risk = {"score": round(score, 1), "level": "LOW", "color": "#28a745"}
+    metrics, score, risk = shield_metrics()
     
     # Get AI analysis
     analysis = "AI analysis unavailable"
@@ -720,10 +358,11 @@ def build_shield_data(ai_result: Optional[Dict] = None) -> Dict:
         'name': 'The Shield',
         'role': 'Risk Environment',
         'mission': 'Detect global risk pressure, cross-asset stress, volatility clusters, and fragility vectors.',
-        'last_update': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'last_update': RUN_TIMESTAMP,
         'scoring': scoring,
         'risk_assessment': risk,
         'metrics': metrics,
+        'price_stale': stale_prices(['JPY', 'CNH', 'TNX', 'MOVE', 'VIX']),
         'ai_analysis': analysis,
         'data_sources': [
             "global_risk",
@@ -770,7 +409,7 @@ def build_coin_data(ai_result: Optional[Dict] = None) -> Dict:
         'name': 'The Coin',
         'role': 'Crypto Intent',
         'mission': 'Track BTC → Alts rotation, detect fakeouts, measure liquidity migration, and infer sentiment momentum.',
-        'last_update': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'last_update': RUN_TIMESTAMP,
         'scoring': scoring,
         'btc_price': btc_price,
         'eth_price': eth_price,
@@ -778,6 +417,7 @@ def build_coin_data(ai_result: Optional[Dict] = None) -> Dict:
         'rsi': btc_rsi,
         'trend': btc_trend,
         'fear_and_greed': {'value': fng_value, 'classification': fng_class},
+        'price_stale': stale_prices(['BTC', 'ETH']),
         'ai_analysis': analysis,
         'data_sources': [
             "orderflow",
@@ -825,7 +465,7 @@ def build_map_data(ai_result: Optional[Dict] = None) -> Dict:
         'name': 'The Map',
         'role': 'Macro',
         'mission': 'Extract hawkish/dovish tone, forward pressure, rate path, and macro wind direction.',
-        'last_update': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'last_update': RUN_TIMESTAMP,
         'scoring': scoring,
         'macro': {
             'oil': oil,
@@ -835,6 +475,7 @@ def build_map_data(ai_result: Optional[Dict] = None) -> Dict:
             'tasi': tasi,
             'treasury_10y': tnx
         },
+        'price_stale': stale_prices(['OIL', 'DXY', 'GOLD', 'SP500', 'TASI', 'TNX']),
         'tasi_mood': tasi_mood,
         'drivers': drivers,
         'ai_analysis': analysis,
@@ -880,7 +521,7 @@ def build_frontier_data(ai_result: Optional[Dict] = None) -> Dict:
         'name': 'The Frontier',
         'role': 'AI & Breakthroughs',
         'mission': 'Monitor breakthroughs in AI, robotics, compute, quantum, and science acceleration.',
-        'last_update': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'last_update': RUN_TIMESTAMP,
         'scoring': scoring,
         'domains': domains,
         'breakthroughs': breakthroughs,
@@ -900,29 +541,10 @@ def build_strategy_data(ai_result: Optional[Dict] = None) -> Dict:
     macro_signal = "Neutral"
     frontier_signal = "Active"
     
-    try:
-        shield_file = DATA_DIR / 'the-shield' / 'latest.json'
-        if shield_file.exists():
-            shield_data = json.loads(shield_file.read_text(encoding='utf-8'))
-            risk_level = shield_data.get('risk_assessment', {}).get('level', risk_level)
-    except:
-        pass
-    
-    try:
-        coin_file = DATA_DIR / 'the-coin' / 'latest.json'
-        if coin_file.exists():
-            coin_data = json.loads(coin_file.read_text(encoding='utf-8'))
-            crypto_momentum = coin_data.get('momentum', crypto_momentum)
-    except:
-        pass
-    
-    try:
-        map_file = DATA_DIR / 'the-map' / 'latest.json'
-        if map_file.exists():
-            map_data = json.loads(map_file.read_text(encoding='utf-8'))
-            macro_signal = map_data.get('tasi_mood', macro_signal)
-    except:
-        pass
+    dashboards = load_dashboards('the-shield', 'the-coin', 'the-map')
+    risk_level = dashboards['the-shield'].get('risk_assessment', {}).get('level', risk_level)
+    crypto_momentum = dashboards['the-coin'].get('momentum', crypto_momentum)
+    macro_signal = dashboards['the-map'].get('tasi_mood', macro_signal)
     
     # Get AI analysis
     stance = "Neutral"
@@ -949,7 +571,7 @@ def build_strategy_data(ai_result: Optional[Dict] = None) -> Dict:
         'name': 'The Strategy',
         'role': 'Market Stance',
         'mission': "Read the market context, interpret cross-domain vectors, and determine today's stance.",
-        'last_update': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'last_update': RUN_TIMESTAMP,
         'scoring': scoring,
         'stance': stance,
         'mindset': mindset,
@@ -991,7 +613,7 @@ def build_library_data(ai_result: Optional[Dict] = None) -> Dict:
         'name': 'The Library',
         'role': 'Free Knowledge',
         'mission': 'Compute the daily human advancement rate, track breakthroughs, and signal long-term trajectory.',
-        'last_update': datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC'),
+        'last_update': RUN_TIMESTAMP,
         'scoring': scoring,
         'summaries': summaries,
         'ai_analysis': analysis,
@@ -1005,54 +627,13 @@ def build_library_data(ai_result: Optional[Dict] = None) -> Dict:
 def build_commander_data(ai_result: Optional[Dict] = None) -> Dict:
     """Build The Commander dashboard data"""
     # Load all dashboard data
-    shield_data = {}
-    coin_data = {}
-    map_data = {}
-    frontier_data = {}
-    strategy_data = {}
-    library_data = {}
-    
-    try:
-        shield_file = DATA_DIR / 'the-shield' / 'latest.json'
-        if shield_file.exists():
-            shield_data = json.loads(shield_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        coin_file = DATA_DIR / 'the-coin' / 'latest.json'
-        if coin_file.exists():
-            coin_data = json.loads(coin_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        map_file = DATA_DIR / 'the-map' / 'latest.json'
-        if map_file.exists():
-            map_data = json.loads(map_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        frontier_file = DATA_DIR / 'the-frontier' / 'latest.json'
-        if frontier_file.exists():
-            frontier_data = json.loads(frontier_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        strategy_file = DATA_DIR / 'the-strategy' / 'latest.json'
-        if strategy_file.exists():
-            strategy_data = json.loads(strategy_file.read_text(encoding='utf-8'))
-    except:
-        pass
-    
-    try:
-        library_file = DATA_DIR / 'the-library' / 'latest.json'
-        if library_file.exists():
-            library_data = json.loads(library_file.read_text(encoding='utf-8'))
-    except:
-        pass
+    dashboards = load_dashboards('the-shield', 'the-coin', 'the-map', 'the-frontier', 'the-strategy', 'the-library')
+    shield_data = dashboards['the-shield']
+    coin_data = dashboards['the-coin']
+    map_data = dashboards['the-map']
+    frontier_data = dashboards['the-frontier']
+    strategy_data = dashboards['the-strategy']
+    library_data = dashboards['the-library']
     
     # Get AI analysis
     morning_brief = {}
@@ -1089,7 +670,7 @@ def build_commander_data(ai_result: Optional[Dict] = None) -> Dict:
         'name': 'The Commander',
         'role': 'Master Orchestrator',
         'mission': 'Combine all dashboards using waterfall loading logic to produce the final unified assessment.',
-        'timestamp': datetime.now(timezone.utc).isoformat(),
+        'timestamp': RUN_STARTED_AT.isoformat(),
         'morning_brief': morning_brief,
         'internal_summary_sentence': "Risk shows the environment, crypto shows sentiment, macro shows the wind, breakthroughs show the future, strategy shows the stance, and knowledge shows the long-term signal — combine all six to guide the user clearly through today.",
         'apps_status': {
@@ -1111,17 +692,20 @@ def main():
     parser.add_argument('--all', action='store_true', help='Run for all dashboards (default)')
     parser.add_argument('--app', type=str, help='Run for specific dashboard (e.g., the-shield)')
     parser.add_argument('--no-ai', action='store_true', help='Disable AI generation to save quota')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore cached fetch/AI results and refresh everything')
     args = parser.parse_args()
 
     if args.no_ai:
         os.environ['DISABLE_AI'] = 'true'
+    if args.no_cache:
+        os.environ['DISABLE_CACHE'] = 'true'
 
     run_all = args.all or not args.app
     target_app = args.app
 
     logger.info("=" * 60)
     logger.info("🚀 DAILY ALPHA LOOP - UNIFIED FETCHER V3")
-    logger.info(f"📅 {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
+    logger.info(f"📅 {RUN_TIMESTAMP}")
     logger.info("=" * 60)
     
     # STEP 1: Fetch ALL data ONCE (centralized)
@@ -1129,23 +713,7 @@ def main():
     logger.info("STEP 1: CENTRALIZED DATA FETCHING")
     logger.info("=" * 60)
     
-    fetch_market_data()
-    time.sleep(1)
-    
-    fetch_crypto_indicators()
-    time.sleep(1)
-    
-    fetch_treasury_data()
-    time.sleep(1)
-    
-    fetch_fear_and_greed()
-    time.sleep(1)
-    
-    fetch_news()
-    time.sleep(1)
-    
-    fetch_arxiv_papers()
-    time.sleep(1)
+    fetch_all()
     
     # STEP 2: Make ONE unified AI call for all dashboards
     logger.info("\n" + "=" * 60)
@@ -1177,8 +745,9 @@ def main():
         'gold': store.get('market.GOLD'),
         'sp500': store.get('market.SP500'),
         'tasi': store.get('market.TASI'),
-        'news_headlines': '\n'.join([f"- {a['title']}" for a in news_articles[:10]]),
-        'arxiv_summary': '\n'.join([f"- {title}" for title in arxiv_papers])
+        'price_stale': stale_prices(['JPY', 'CNH', 'TNX', 'MOVE', 'VIX', 'BTC', 'ETH', 'OIL', 'DXY', 'GOLD', 'SP500', 'TASI']),
+        'news_headlines': bullet_list([a['title'] for a in news_articles[:10]]),
+        'arxiv_summary': bullet_list(arxiv_papers)
     }
     
     # Make the unified AI call
@@ -1193,37 +762,31 @@ def main():
     
     def save_dashboard(data, folder_name):
         dashboards.append(data)
-        (DATA_DIR / folder_name).mkdir(parents=True, exist_ok=True)
-        (DATA_DIR / folder_name / 'latest.json').write_text(json.dumps(data, indent=2), encoding='utf-8')
-        logger.info(f"✅ Saved {folder_name}")
-
-    if run_all or target_app == 'the-shield':
-        logger.info("\n📊 Building: The Shield")
-        save_dashboard(build_shield_data(ai_result), 'the-shield')
-
-    if run_all or target_app == 'the-coin':
-        logger.info("\n📊 Building: The Coin")
-        save_dashboard(build_coin_data(ai_result), 'the-coin')
-
-    if run_all or target_app == 'the-map':
-        logger.info("\n📊 Building: The Map")
-        save_dashboard(build_map_data(ai_result), 'the-map')
-
-    if run_all or target_app == 'the-frontier':
-        logger.info("\n📊 Building: The Frontier")
-        save_dashboard(build_frontier_data(ai_result), 'the-frontier')
-
-    if run_all or target_app == 'the-library':
-        logger.info("\n📊 Building: The Library")
-        save_dashboard(build_library_data(ai_result), 'the-library')
-
-    if run_all or target_app == 'the-strategy':
-        logger.info("\n📊 Building: The Strategy")
-        save_dashboard(build_strategy_data(ai_result), 'the-strategy')
-
-    if run_all or target_app == 'the-commander':
-        logger.info("\n📊 Building: The Commander")
-        save_dashboard(build_commander_data(ai_result), 'the-commander')
+        # Kept in memory too, so Strategy/Commander don't re-read what was just written
+        store.set(f'dashboard.{folder_name}', data)
+        if write_dashboard(folder_name, data):
+            logger.info(f"✅ Saved {folder_name}")
+        else:
+            logger.info(f"✅ {folder_name} unchanged since last run, kept existing file and its last_update")
+
+    # Resolve the requested builders once, in order - Strategy and Commander
+    # come last because they read the dashboards saved before them
+    builders = (
+        ('the-shield', 'The Shield', build_shield_data),
+        ('the-coin', 'The Coin', build_coin_data),
+        ('the-map', 'The Map', build_map_data),
+        ('the-frontier', 'The Frontier', build_frontier_data),
+        ('the-library', 'The Library', build_library_data),
+        ('the-strategy', 'The Strategy', build_strategy_data),
+        ('the-commander', 'The Commander', build_commander_data),
+    )
+    tasks = [(folder, label, build) for folder, label, build in builders if run_all or target_app == folder]
+    if not tasks:
+        logger.warning(f"⚠️ Unknown dashboard: {target_app}")
+    
+    for folder, label, build in tasks:
+        logger.info(f"\n📊 Building: {label}")
+        save_dashboard(build(ai_result), folder)
     
     # Summary
     logger.info("\n" + "=" * 60)